@@ -23,3 +23,15 @@ BACKEND_API_HOST = os.getenv("BACKEND_API_HOST", "127.0.0.1")
 BACKEND_API_PORT = os.getenv("BACKEND_API_PORT", 8000)
 BACKEND_API_USERNAME = os.getenv("BACKEND_API_USERNAME", "admin")
 BACKEND_API_PASSWORD = os.getenv("BACKEND_API_PASSWORD", "admin")
+BACKEND_API_POOL_SIZE = int(os.getenv("BACKEND_API_POOL_SIZE", 20))
+BACKEND_API_CONNECT_TIMEOUT = float(os.getenv("BACKEND_API_CONNECT_TIMEOUT", 3.05))
+BACKEND_API_READ_TIMEOUT = float(os.getenv("BACKEND_API_READ_TIMEOUT", 30))
+BACKEND_API_MAX_RETRIES = int(os.getenv("BACKEND_API_MAX_RETRIES", 3))
+BACKEND_API_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("BACKEND_API_CIRCUIT_FAILURE_THRESHOLD", 5))
+BACKEND_API_CIRCUIT_RESET_TIMEOUT = float(os.getenv("BACKEND_API_CIRCUIT_RESET_TIMEOUT", 15))
+BACKEND_API_CACHE_TTL = float(os.getenv("BACKEND_API_CACHE_TTL", 10))
+BACKEND_API_MAX_CONCURRENCY = int(os.getenv("BACKEND_API_MAX_CONCURRENCY", 40))
+CHECKPOINT_CACHE_TTL = float(os.getenv("CHECKPOINT_CACHE_TTL", 300))
+DOCKER_STATUS_REFRESH_INTERVAL = float(os.getenv("DOCKER_STATUS_REFRESH_INTERVAL", 5))
+DOCKER_STATUS_STALE_AFTER = float(os.getenv("DOCKER_STATUS_STALE_AFTER", 30))
+DOCKER_STATUS_PROBE_TIMEOUT = float(os.getenv("DOCKER_STATUS_PROBE_TIMEOUT", 2))
@@ -0,0 +1,253 @@
+import asyncio
+import base64
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import pandas as pd
+import streamlit as st
+
+from backend.services.backend_api_client import BackendAPIClient
+from backend.services.payload_codecs import (
+    decode_results,
+    decode_table,
+    is_binary_table_response,
+    read_binary_table,
+    table_request_headers,
+)
+from backend.services.request_policy import RequestPolicy
+
+
+class AsyncBackendAPIClient:
+    """
+    Asyncio companion of the BackendAPIClient for the read-only endpoints that pages query for many bots at once. Its
+    endpoint methods are coroutines backed by a pooled aiohttp session, plus fan-out helpers that query many bots
+    concurrently. The session is bound to the event loop that opens it, so the client is meant to be used as an async
+    context manager. It is short-lived by design, so it doesn't keep a response cache:
+
+        async with AsyncBackendAPIClient.from_client(backend_api_client) as client:
+            statuses = await client.get_bot_status_many(bot_names)
+
+    Only read-only endpoints are mirrored. Endpoints that change the backend state stay on the BackendAPIClient, which
+    invalidates its cached responses when they run.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 8000, username: str = "admin", password: str = "admin",
+                 pool_size: int = 20, connect_timeout: float = 3.05, read_timeout: Optional[float] = 30,
+                 policy: Optional[RequestPolicy] = None, max_concurrency: int = 10):
+        self.host = host
+        self.port = port
+        self.base_url = f"http://{self.host}:{self.port}"
+        self.username = username
+        self.password = password
+        self.policy = policy or RequestPolicy(connect_timeout=connect_timeout, read_timeout=read_timeout)
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_client(cls, client: BackendAPIClient, **kwargs) -> "AsyncBackendAPIClient":
+        """
+        Build an async client that talks to the same backend, with the same credentials, as a sync client. The request
+        policy is shared, so both clients see the same circuit breaker.
+        """
+        return cls(host=client.host, port=client.port, username=client.auth.username, password=client.auth.password,
+                   pool_size=client.pool_size, policy=client.policy, **kwargs)
+
+    async def __aenter__(self) -> "AsyncBackendAPIClient":
+        pool_size = max(self.pool_size, self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=pool_size, limit_per_host=pool_size)
+        credentials = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+        self.session = aiohttp.ClientSession(connector=connector, headers={"Authorization": f"Basic {credentials}"})
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled connections of the client."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def post(self, endpoint: str, payload: Optional[Dict] = None, params: Optional[Dict] = None):
+        """
+        Post request to the backend API.
+        :param params:
+        :param endpoint:
+        :param payload:
+        :return:
+        """
+        return await self._send("POST", endpoint, json=payload, params=self._clean_params(params))
+
+    async def get(self, endpoint: str):
+        """
+        Get request to the backend API.
+        :param endpoint:
+        :return:
+        """
+        return await self._send("GET", endpoint)
+
+    async def _post_table(self, endpoint: str, payload: Optional[Dict] = None) -> Optional[pd.DataFrame]:
+        """
+        Post request to an endpoint whose whole body is a table, like `BackendAPIClient._post_table`.
+        :return: The table, or None when the backend returned an error.
+        """
+        return await self._send("POST", endpoint, json=payload, headers=table_request_headers(), table=True)
+
+    async def _post_with_tables(self, endpoint: str, payload: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """
+        Post request to an endpoint that returns a JSON object holding tables, like
+        `BackendAPIClient._post_with_tables`.
+        :return: The decoded JSON object, or None when the backend returned an error.
+        """
+        return await self._send("POST", endpoint, json=payload, headers=table_request_headers())
+
+    async def _send(self, method: str, endpoint: str, table: bool = False, **kwargs):
+        """
+        Send a request with the endpoint timeout of the policy and report its outcome to the circuit breaker. Requests
+        are not retried, a failed fan-out entry is simply reported as missing.
+        :param table: Whether the whole body is a table, sent as an Arrow IPC stream, a Parquet file or JSON.
+        :return: The decoded JSON body, or the table when `table` is set.
+        """
+        url = f"{self.base_url}/{endpoint}"
+        connect_timeout, read_timeout = self.policy.timeout_for(endpoint)
+        timeout = aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout)
+        self.policy.before_request()
+        try:
+            async with self.session.request(method, url, timeout=timeout, **kwargs) as response:
+                if response.status >= 500:
+                    self.policy.record_failure()
+                else:
+                    self.policy.record_success()
+                if response.status == 200 and is_binary_table_response(response.content_type):
+                    if not table:
+                        raise ValueError(f"Backend API answered {endpoint} with a bare {response.content_type} table "
+                                         f"instead of a JSON object holding its tables.")
+                    return read_binary_table(await response.read(), response.content_type)
+                body = await self._process_async_response(response)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.policy.record_failure()
+            raise
+        if table and body is not None:
+            return decode_table(body)
+        return body
+
+    @staticmethod
+    def _clean_params(params: Optional[Dict]) -> Optional[Dict]:
+        # aiohttp only accepts str/int/float query values, while requests serializes booleans as "True"/"False".
+        if params is None:
+            return None
+        return {key: str(value) if isinstance(value, bool) else value for key, value in params.items()}
+
+    @staticmethod
+    async def _process_async_response(response: aiohttp.ClientResponse):
+        if response.status == 401:
+            st.error("You are not authorized to access Backend API. Please check your credentials.")
+            return
+        elif response.status == 400:
+            st.error((await response.json())["detail"])
+            return
+        elif response.status >= 500:
+            st.error(f"Backend API error {response.status}: {await response.text()}")
+            return
+        return await response.json()
+
+    async def is_docker_running(self):
+        """Check if Docker is running."""
+        endpoint = "is-docker-running"
+        return (await self.get(endpoint))["is_docker_running"]
+
+    async def get_available_images(self, image_name: str = "hummingbot"):
+        """Get available images."""
+        endpoint = f"available-images/{image_name}"
+        return (await self.get(endpoint))["available_images"]
+
+    async def get_bot_status(self, bot_name: str):
+        """Get the status of a bot."""
+        endpoint = f"get-bot-status/{bot_name}"
+        return await self.get(endpoint)
+
+    async def get_all_configs_from_bot(self, bot_name: str):
+        """Get all configurations from a bot."""
+        endpoint = f"all-controller-configs/bot/{bot_name}"
+        return await self.get(endpoint)
+
+    async def get_bot_history(self, bot_name: str):
+        """Get the historical data of a bot."""
+        endpoint = f"get-bot-history/{bot_name}"
+        return await self.get(endpoint)
+
+    async def get_active_bots_status(self):
+        """
+        Retrieve the cached status of all active bots.
+        Returns a JSON response with the status and data of active bots.
+        """
+        endpoint = "get-active-bots-status"
+        return await self.get(endpoint)
+
+    async def get_all_controllers_config(self):
+        """Get all controller configurations."""
+        endpoint = "all-controller-configs"
+        return await self.get(endpoint)
+
+    async def get_historical_candles(self, connector: str, trading_pair: str, interval: str, start_time: int,
+                                     end_time: int):
+        """Get historical candles data as a DataFrame."""
+        endpoint = "historical-candles"
+        payload = {
+            "connector_name": connector,
+            "trading_pair": trading_pair,
+            "interval": interval,
+            "start_time": start_time,
+            "end_time": end_time
+        }
+        return await self._post_table(endpoint, payload=payload)
+
+    async def run_backtesting(self, start_time: int, end_time: int, backtesting_resolution: str, trade_cost: float,
+                              config: dict):
+        """Run backtesting."""
+        endpoint = "run-backtesting"
+        payload = {
+            "start_time": start_time,
+            "end_time": end_time,
+            "backtesting_resolution": backtesting_resolution,
+            "trade_cost": trade_cost,
+            "config": config
+        }
+        return decode_results(endpoint, await self._post_with_tables(endpoint, payload=payload))
+
+    async def get_performance_results(self, executors: List[Dict[str, Any]]):
+        if not isinstance(executors, list) or len(executors) == 0:
+            raise ValueError("Executors must be a non-empty list of dictionaries")
+        if not all(isinstance(executor, dict) for executor in executors):
+            raise ValueError("All elements in executors must be dictionaries")
+        endpoint = "get-performance-results"
+        payload = {
+            "executors": executors,
+        }
+        return decode_results(endpoint, await self._post_with_tables(endpoint, payload=payload))
+
+    async def _fan_out(self, method, keys: List[str]) -> Dict[str, Any]:
+        """
+        Call `method(key)` for every key concurrently. The semaphore is shared by all the fan-outs of the session, so
+        at most `max_concurrency` requests are in flight at any time.
+        :param method: Coroutine function taking a single key.
+        :param keys: Keys to query, e.g. bot names.
+        :return: Dictionary mapping every key to its response, or to None when its request failed.
+        """
+        async def bounded_call(key: str):
+            async with self._semaphore:
+                return await method(key)
+
+        responses = await asyncio.gather(*(bounded_call(key) for key in keys), return_exceptions=True)
+        return {key: None if isinstance(response, Exception) else response for key, response in zip(keys, responses)}
+
+    async def get_bot_status_many(self, bot_names: List[str]) -> Dict[str, Any]:
+        """Get the status of several bots concurrently."""
+        return await self._fan_out(self.get_bot_status, bot_names)
+
+    async def get_all_configs_from_bots(self, bot_names: List[str]) -> Dict[str, Any]:
+        """Get all controller configurations of several bots concurrently."""
+        return await self._fan_out(self.get_all_configs_from_bot, bot_names)
@@ -1,11 +1,35 @@
-from typing import Any, Dict, List, Optional
+import copy
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
 import streamlit as st
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+from backend.services.payload_codecs import (
+    ACCEPT_ENCODING,
+    decode_results,
+    decode_table,
+    is_binary_table_response,
+    read_binary_table,
+    table_request_headers,
+)
+from backend.services.request_policy import BackendAPIUnavailable, RequestPolicy
+
+
+@dataclass
+class CachedResponse:
+    data: Any
+    etag: Optional[str]
+    content_hash: str
+    timestamp: float
+
 
 class BackendAPIClient:
     """
@@ -14,41 +38,214 @@ class BackendAPIClient:
     of the active bots.
     """
     _shared_instance = None
+    _shared_instance_lock = threading.Lock()
+    # Read-only endpoints are cached under a tag, and the mutating endpoints invalidate the tags they affect.
+    DEFAULT_CACHE_TTLS = {
+        "connectors_config_map": 300,
+    }
 
     @classmethod
     def get_instance(cls, *args, **kwargs) -> "BackendAPIClient":
         if cls._shared_instance is None:
-            cls._shared_instance = BackendAPIClient(*args, **kwargs)
+            with cls._shared_instance_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = BackendAPIClient(*args, **kwargs)
         return cls._shared_instance
 
-    def __init__(self, host: str = "localhost", port: int = 8000, username: str = "admin", password: str = "admin"):
+    def __init__(self, host: str = "localhost", port: int = 8000, username: str = "admin", password: str = "admin",
+                 pool_size: int = 20, connect_timeout: float = 3.05, read_timeout: Optional[float] = 30,
+                 cache_ttl: float = 10, cache_ttls: Optional[Dict[str, float]] = None,
+                 policy: Optional[RequestPolicy] = None, max_retries: int = 3, failure_threshold: int = 5,
+                 reset_timeout: float = 15):
         self.host = host
         self.port = port
         self.base_url = f"http://{self.host}:{self.port}"
         self.auth = HTTPBasicAuth(username, password)
-
-    def post(self, endpoint: str, payload: Optional[Dict] = None, params: Optional[Dict] = None):
+        self.policy = policy or RequestPolicy(connect_timeout=connect_timeout, read_timeout=read_timeout,
+                                              max_retries=max_retries, failure_threshold=failure_threshold,
+                                              reset_timeout=reset_timeout)
+        self.pool_size = pool_size
+        self.session = self._create_session(pool_size)
+        self.cache_ttl = cache_ttl
+        self.cache_ttls = {**self.DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        self._response_cache: Dict[tuple, CachedResponse] = {}
+        self._cache_generations: Dict[str, int] = {}
+        self._cache_lock = threading.Lock()
+
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """
+        Create a keep-alive session with a connection pool sized for concurrent Streamlit script threads. The
+        underlying urllib3 pool is thread-safe, so a single session is shared by every caller of the instance.
+        :param pool_size: Maximum number of connections kept alive to the backend host.
+        :return:
+        """
+        session = requests.Session()
+        session.auth = self.auth
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        """Close the pooled connections of the client."""
+        self.session.close()
+
+    def post(self, endpoint: str, payload: Optional[Dict] = None, params: Optional[Dict] = None,
+             cache_tag: Optional[str] = None):
         """
         Post request to the backend API.
         :param params:
         :param endpoint:
         :param payload:
+        :param cache_tag: Cache the response under this tag. Only for endpoints that don't modify the backend state.
         :return:
         """
-        url = f"{self.base_url}/{endpoint}"
-        response = requests.post(url, json=payload, params=params, auth=self.auth)
+        if cache_tag is not None:
+            return self._cached_request("POST", endpoint, cache_tag, payload=payload, params=params)
+        response = self._send("POST", endpoint, idempotent=False, json=payload, params=params)
         return self._process_response(response)
 
-    def get(self, endpoint: str):
+    def get(self, endpoint: str, cache_tag: Optional[str] = None):
         """
         Get request to the backend API.
         :param endpoint:
+        :param cache_tag: Cache the response under this tag.
         :return:
         """
+        if cache_tag is not None:
+            return self._cached_request("GET", endpoint, cache_tag)
+        response = self._send("GET", endpoint, idempotent=True)
+        return self._process_response(response)
+
+    def _send(self, method: str, endpoint: str, idempotent: bool, timeout: Optional[Tuple[float, Optional[float]]] = None,
+              **kwargs) -> requests.Response:
+        """
+        Send a request under the client RequestPolicy: endpoint timeout, jittered retries of idempotent requests on
+        connection errors, timeouts and 5xx responses, and circuit breaker bookkeeping.
+        :param method:
+        :param endpoint:
+        :param idempotent: Whether the request can be safely retried.
+        :param timeout: (connect, read) timeout overriding the one of the policy for the endpoint.
+        :param kwargs: Extra arguments for requests.Session.request.
+        :return: The last response received. Raises the last connection error when no response was received.
+        """
         url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, auth=self.auth)
+        timeout = timeout or self.policy.timeout_for(endpoint)
+        max_retries = self.policy.max_retries if idempotent else 0
+        self.policy.before_request()
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == max_retries:
+                    self.policy.record_failure()
+                    raise
+            except Exception:
+                self.policy.record_failure()
+                raise
+            else:
+                if response.status_code < 500:
+                    self.policy.record_success()
+                    return response
+                if attempt == max_retries:
+                    self.policy.record_failure()
+                    return response
+            self.policy.record_retry()
+            time.sleep(self.policy.backoff(attempt))
+
+    def _post_table(self, endpoint: str, payload: Optional[Dict] = None, params: Optional[Dict] = None,
+                    idempotent: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Post request to an endpoint whose whole body is a table, advertising the binary table formats the client can
+        decode.
+        :return: The table, sent as an Arrow IPC stream, a Parquet file or JSON, or None when the backend returned an
+        error.
+        """
+        response = self._send("POST", endpoint, idempotent=idempotent, json=payload, params=params,
+                              headers=table_request_headers())
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code == 200 and is_binary_table_response(content_type):
+            return read_binary_table(response.content, content_type)
+        table = self._process_response(response)
+        return decode_table(table) if table is not None else None
+
+    def _post_with_tables(self, endpoint: str, payload: Optional[Dict] = None, params: Optional[Dict] = None,
+                          idempotent: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Post request to an endpoint that returns a JSON object holding tables, advertising the binary table formats
+        the client can decode.
+        :return: The decoded JSON object, whose table fields must be read with `decode_table`, or None when the backend
+        returned an error.
+
+        Raises:
+        - ValueError: If the backend answered with a bare binary table instead of a JSON object.
+        """
+        response = self._send("POST", endpoint, idempotent=idempotent, json=payload, params=params,
+                              headers=table_request_headers())
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code == 200 and is_binary_table_response(content_type):
+            raise ValueError(f"Backend API answered {endpoint} with a bare {content_type} table instead of a JSON "
+                             f"object holding its tables.")
         return self._process_response(response)
 
+    def _cached_request(self, method: str, endpoint: str, cache_tag: str, payload: Optional[Any] = None,
+                        params: Optional[Dict] = None):
+        """
+        Serve a read-only request from the response cache while it is fresh. Once the TTL of the tag expires the
+        request is revalidated with If-None-Match when the backend sent an ETag, and otherwise by comparing the hash of
+        the body, so an unchanged payload is not parsed again. Callers get a copy they are free to mutate. While the
+        backend is failing, the last cached value is served instead of an error.
+        """
+        key = (cache_tag, method, endpoint, tuple(sorted(params.items())) if params else None,
+               json.dumps(payload, sort_keys=True) if payload is not None else None)
+        with self._cache_lock:
+            cached = self._response_cache.get(key)
+            generation = self._cache_generations.get(cache_tag, 0)
+        if cached is not None and time.time() - cached.timestamp < self.cache_ttls.get(cache_tag, self.cache_ttl):
+            return copy.deepcopy(cached.data)
+
+        headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else None
+        try:
+            response = self._send(method, endpoint, idempotent=True, json=payload, params=params, headers=headers)
+        except (BackendAPIUnavailable, requests.ConnectionError, requests.Timeout):
+            if cached is None:
+                raise
+            return copy.deepcopy(cached.data)
+        if cached is not None and response.status_code == 304:
+            cached.timestamp = time.time()
+            return copy.deepcopy(cached.data)
+        if cached is not None and response.status_code >= 500:
+            return copy.deepcopy(cached.data)
+        if response.status_code != 200:
+            return self._process_response(response)
+
+        content_hash = hashlib.sha1(response.content).hexdigest()
+        if cached is not None and cached.content_hash == content_hash:
+            cached.timestamp = time.time()
+            return copy.deepcopy(cached.data)
+        data = response.json()
+        with self._cache_lock:
+            # A mutating call that ran while the request was in flight makes the response potentially outdated.
+            if self._cache_generations.get(cache_tag, 0) == generation:
+                self._response_cache[key] = CachedResponse(data=data, etag=response.headers.get("ETag"),
+                                                           content_hash=content_hash, timestamp=time.time())
+        return copy.deepcopy(data)
+
+    def invalidate_cache(self, *cache_tags: str):
+        """
+        Drop the cached responses of the given tags, or of every tag when none is given.
+        :param cache_tags:
+        :return:
+        """
+        with self._cache_lock:
+            if not cache_tags:
+                cache_tags = tuple({key[0] for key in self._response_cache})
+            for cache_tag in cache_tags:
+                self._cache_generations[cache_tag] = self._cache_generations.get(cache_tag, 0) + 1
+            self._response_cache = {key: value for key, value in self._response_cache.items()
+                                    if key[0] not in cache_tags}
+
     @staticmethod
     def _process_response(response):
         if response.status_code == 401:
@@ -57,17 +254,31 @@ class BackendAPIClient:
         elif response.status_code == 400:
             st.error(response.json()["detail"])
             return
+        elif response.status_code >= 500:
+            st.error(f"Backend API error {response.status_code}: {response.text}")
+            return
         return response.json()
 
-    def is_docker_running(self):
-        """Check if Docker is running."""
+    def is_docker_running(self, timeout: Optional[float] = None):
+        """
+        Check if Docker is running.
+        :param timeout: Connect and read timeout of a single attempt without retries, for health checks that must
+        answer quickly. Errors are raised instead of displayed. When None, the request follows the client policy.
+        :return:
+        """
         endpoint = "is-docker-running"
-        return self.get(endpoint)["is_docker_running"]
+        if timeout is None:
+            return self.get(endpoint)["is_docker_running"]
+        response = self._send("GET", endpoint, idempotent=False, timeout=(timeout, timeout))
+        response.raise_for_status()
+        return response.json()["is_docker_running"]
 
     def pull_image(self, image_name: str):
         """Pull a Docker image."""
         endpoint = "pull-image"
-        return self.post(endpoint, payload={"image_name": image_name})
+        response = self.post(endpoint, payload={"image_name": image_name})
+        self.invalidate_cache("images")
+        return response
 
     def list_available_images(self, image_name: str):
         """List available images by name."""
@@ -149,12 +360,12 @@ class BackendAPIClient:
     def get_all_controllers_config(self):
         """Get all controller configurations."""
         endpoint = "all-controller-configs"
-        return self.get(endpoint)
+        return self.get(endpoint, cache_tag="controller_configs")
 
     def get_available_images(self, image_name: str = "hummingbot"):
         """Get available images."""
         endpoint = f"available-images/{image_name}"
-        return self.get(endpoint)["available_images"]
+        return self.get(endpoint, cache_tag="images")["available_images"]
 
     def add_script_config(self, script_config: dict):
         """Add a new script configuration."""
@@ -168,12 +379,16 @@ class BackendAPIClient:
             "name": controller_config["id"],
             "content": controller_config
         }
-        return self.post(endpoint, payload=config)
+        response = self.post(endpoint, payload=config)
+        self.invalidate_cache("controller_configs")
+        return response
 
     def delete_controller_config(self, controller_name: str):
         """Delete a controller configuration."""
         url = "delete-controller-config"
-        return self.post(url, params={"config_name": controller_name})
+        response = self.post(url, params={"config_name": controller_name})
+        self.invalidate_cache("controller_configs")
+        return response
 
     def delete_script_config(self, script_name: str):
         """Delete a script configuration."""
@@ -183,7 +398,9 @@ class BackendAPIClient:
     def delete_all_controller_configs(self):
         """Delete all controller configurations."""
         endpoint = "delete-all-controller-configs"
-        return self.post(endpoint)
+        response = self.post(endpoint)
+        self.invalidate_cache("controller_configs")
+        return response
 
     def delete_all_script_configs(self):
         """Delete all script configurations."""
@@ -202,7 +419,7 @@ class BackendAPIClient:
         return self.post(endpoint, payload=payload)
 
     def get_historical_candles(self, connector: str, trading_pair: str, interval: str, start_time: int, end_time: int):
-        """Get historical candles data."""
+        """Get historical candles data as a DataFrame."""
         endpoint = "historical-candles"
         payload = {
             "connector_name": connector,
@@ -211,7 +428,7 @@ class BackendAPIClient:
             "start_time": start_time,
             "end_time": end_time
         }
-        return self.post(endpoint, payload=payload)
+        return self._post_table(endpoint, payload=payload, idempotent=True)
 
     def run_backtesting(self, start_time: int, end_time: int, backtesting_resolution: str, trade_cost: float, config: dict):
         """Run backtesting."""
@@ -223,22 +440,7 @@ class BackendAPIClient:
             "trade_cost": trade_cost,
             "config": config
         }
-        backtesting_results = self.post(endpoint, payload=payload)
-        if "error" in backtesting_results:
-            raise Exception(backtesting_results["error"])
-        if "processed_data" not in backtesting_results:
-            data = None
-        else:
-            data = pd.DataFrame(backtesting_results["processed_data"])
-        if "executors" not in backtesting_results:
-            executors = []
-        else:
-            executors = [ExecutorInfo(**executor) for executor in backtesting_results["executors"]]
-        return {
-            "processed_data": data,
-            "executors": executors,
-            "results": backtesting_results["results"]
-        }
+        return decode_results(endpoint, self._post_with_tables(endpoint, payload=payload))
 
     def get_all_configs_from_bot(self, bot_name: str):
         """Get all configurations from a bot."""
@@ -260,42 +462,50 @@ class BackendAPIClient:
     def get_connector_config_map(self, connector_name: str):
         """Get connector configuration map."""
         endpoint = f"connector-config-map/{connector_name}"
-        return self.get(endpoint)
+        return self.get(endpoint, cache_tag="connectors_config_map")
 
     def get_all_connectors_config_map(self):
         """Get all connector configuration maps."""
         endpoint = "all-connectors-config-map"
-        return self.get(endpoint)
+        return self.get(endpoint, cache_tag="connectors_config_map")
 
     def add_account(self, account_name: str):
         """Add a new account."""
         endpoint = "add-account"
-        return self.post(endpoint, params={"account_name": account_name})
+        response = self.post(endpoint, params={"account_name": account_name})
+        self.invalidate_cache("accounts")
+        return response
 
     def delete_account(self, account_name: str):
         """Delete an account."""
         endpoint = "delete-account"
-        return self.post(endpoint, params={"account_name": account_name})
+        response = self.post(endpoint, params={"account_name": account_name})
+        self.invalidate_cache("accounts", "credentials")
+        return response
 
     def delete_credential(self, account_name: str, connector_name: str):
         """Delete credentials."""
         endpoint = f"delete-credential/{account_name}/{connector_name}"
-        return self.post(endpoint)
+        response = self.post(endpoint)
+        self.invalidate_cache("credentials")
+        return response
 
     def add_connector_keys(self, account_name: str, connector_name: str, connector_config: dict):
         """Add connector keys."""
         endpoint = f"add-connector-keys/{account_name}/{connector_name}"
-        return self.post(endpoint, payload=connector_config)
+        response = self.post(endpoint, payload=connector_config)
+        self.invalidate_cache("credentials")
+        return response
 
     def get_accounts(self):
         """Get available credentials."""
         endpoint = "list-accounts"
-        return self.get(endpoint)
+        return self.get(endpoint, cache_tag="accounts")
 
     def get_credentials(self, account_name: str):
         """Get available credentials."""
         endpoint = f"list-credentials/{account_name}"
-        return self.get(endpoint)
+        return self.get(endpoint, cache_tag="credentials")
 
     def get_accounts_state(self):
         """Get all balances."""
@@ -318,24 +528,7 @@ class BackendAPIClient:
             "executors": executors,
         }
 
-        performance_results = self.post(endpoint, payload=payload)
-        if "error" in performance_results:
-            raise Exception(performance_results["error"])
-        if "detail" in performance_results:
-            raise Exception(performance_results["detail"])
-        if "processed_data" not in performance_results:
-            data = None
-        else:
-            data = pd.DataFrame(performance_results["processed_data"])
-        if "executors" not in performance_results:
-            executors = []
-        else:
-            executors = [ExecutorInfo(**executor) for executor in performance_results["executors"]]
-        return {
-            "processed_data": data,
-            "executors": executors,
-            "results": performance_results["results"]
-        }
+        return decode_results(endpoint, self._post_with_tables(endpoint, payload=payload))
 
     def list_databases(self):
         """Get databases list."""
@@ -350,16 +543,32 @@ class BackendAPIClient:
     def create_checkpoint(self, db_names: List[str]):
         """Create a checkpoint."""
         endpoint = "create-checkpoint"
-        return self.post(endpoint, payload=db_names)
+        response = self.post(endpoint, payload=db_names)
+        self.invalidate_cache("checkpoints")
+        return response
 
     def list_checkpoints(self, full_path: bool):
         """List checkpoints."""
         endpoint = "list-checkpoints"
         params = {"full_path": full_path}
-        return self.post(endpoint, params=params)
+        return self.post(endpoint, params=params, cache_tag="checkpoints")
 
     def load_checkpoint(self, checkpoint_path: str):
-        """Load a checkpoint."""
+        """
+        Load a checkpoint. Each table is returned either as a JSON string or, when the backend supports binary
+        tables, as an encoded table to be read with `decode_table`.
+        """
         endpoint = "load-checkpoint"
         params = {"checkpoint_path": checkpoint_path}
-        return self.post(endpoint, params=params)
+        return self._post_with_tables(endpoint, params=params, idempotent=True)
+
+    def load_checkpoint_response(self, checkpoint_path: str) -> requests.Response:
+        """
+        Send the load-checkpoint request and return the raw response, for callers that keep their own copy of the
+        checkpoint.
+        :param checkpoint_path:
+        :return:
+        """
+        endpoint = "load-checkpoint"
+        params = {"checkpoint_path": checkpoint_path}
+        return self._send("POST", endpoint, idempotent=True, params=params, headers=table_request_headers())
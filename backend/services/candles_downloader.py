@@ -0,0 +1,127 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
+
+import pandas as pd
+
+from backend.services.backend_api_client import BackendAPIClient
+
+INTERVAL_UNITS_TO_SECS = {
+    "s": 1,
+    "m": 60,
+    "h": 60 * 60,
+    "d": 60 * 60 * 24,
+    "w": 60 * 60 * 24 * 7,
+}
+
+
+def interval_to_seconds(interval: str) -> int:
+    """Convert a candles interval like "1s", "15m" or "4h" to seconds."""
+    return int(interval[:-1]) * INTERVAL_UNITS_TO_SECS[interval[-1]]
+
+
+class CandlesDownloader:
+    """
+    Download historical candles in interval-aligned windows of `candles_per_chunk` candles. Windows are fetched
+    concurrently and each one is written to its own file in `chunks_dir` as soon as it arrives, so memory stays bounded
+    by `max_workers` chunks. A chunk file only appears once it is completely written, so running the download again
+    after a failure skips the completed windows and resumes from there.
+    """
+
+    def __init__(self, backend_api_client: BackendAPIClient, connector: str, trading_pair: str, interval: str,
+                 start_time: int, end_time: int, output_dir: str, candles_per_chunk: int = 1000, max_workers: int = 4):
+        self.backend_api_client = backend_api_client
+        self.connector = connector
+        self.trading_pair = trading_pair
+        self.interval = interval
+        self.interval_secs = interval_to_seconds(interval)
+        self.start_time = start_time - start_time % self.interval_secs
+        self.end_time = end_time
+        self.candles_per_chunk = candles_per_chunk
+        self.max_workers = max_workers
+        self.name = f"{connector}_{trading_pair}_{interval}_{self.start_time}_{self.end_time}"
+        self.chunks_dir = os.path.join(output_dir, self.name)
+
+    def windows(self) -> List[Tuple[int, int]]:
+        """Split [start_time, end_time] in consecutive windows holding `candles_per_chunk` candles each."""
+        span = self.candles_per_chunk * self.interval_secs
+        return [(window_start, min(window_start + span - self.interval_secs, self.end_time))
+                for window_start in range(self.start_time, self.end_time + 1, span)]
+
+    def chunk_path(self, window: Tuple[int, int]) -> str:
+        return os.path.join(self.chunks_dir, f"{window[0]}_{window[1]}.csv")
+
+    def pending_windows(self) -> List[Tuple[int, int]]:
+        return [window for window in self.windows() if not os.path.exists(self.chunk_path(window))]
+
+    def download(self, on_progress: Optional[Callable[[int, int], None]] = None):
+        """
+        Fetch every window that is not on disk yet.
+        :param on_progress: Called with (completed_chunks, total_chunks) every time a chunk is written.
+        :return:
+        """
+        os.makedirs(self.chunks_dir, exist_ok=True)
+        total_chunks = len(self.windows())
+        pending = self.pending_windows()
+        completed_chunks = total_chunks - len(pending)
+        if on_progress is not None:
+            on_progress(completed_chunks, total_chunks)
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._download_window, window): window for window in pending}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                completed_chunks += 1
+                if on_progress is not None:
+                    on_progress(completed_chunks, total_chunks)
+        if errors:
+            raise RuntimeError(f"{len(errors)} of {total_chunks} chunks failed, download again to resume. "
+                               f"First error: {errors[0]}")
+
+    def _download_window(self, window: Tuple[int, int]):
+        candles = self.backend_api_client.get_historical_candles(self.connector, self.trading_pair, self.interval,
+                                                                 start_time=window[0], end_time=window[1])
+        if candles is None:
+            raise RuntimeError(f"Backend API returned no data for window {window}")
+        path = self.chunk_path(window)
+        tmp_path = f"{path}.tmp"
+        candles.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def merge(self, output_path: str, keep_chunks: bool = False) -> str:
+        """
+        Concatenate the chunks in time order into a single CSV, one chunk in memory at a time. Candles repeated at
+        the window boundaries are dropped.
+        :param output_path:
+        :param keep_chunks: Keep the chunks directory once the CSV is written, otherwise it is deleted.
+        :return: The output path.
+        """
+        tmp_path = f"{output_path}.tmp"
+        last_timestamp = None
+        header = True
+        for window in self.windows():
+            try:
+                chunk = pd.read_csv(self.chunk_path(window))
+            except pd.errors.EmptyDataError:
+                continue
+            if chunk.empty:
+                continue
+            chunk = chunk.drop_duplicates(subset="timestamp").sort_values("timestamp")
+            if last_timestamp is not None:
+                chunk = chunk[chunk["timestamp"] > last_timestamp]
+            if chunk.empty:
+                continue
+            chunk.to_csv(tmp_path, index=False, header=header, mode="w" if header else "a")
+            header = False
+            last_timestamp = chunk["timestamp"].iloc[-1]
+        if header:
+            pd.DataFrame(columns=["timestamp"]).to_csv(tmp_path, index=False)
+        os.replace(tmp_path, output_path)
+        if not keep_chunks:
+            shutil.rmtree(self.chunks_dir, ignore_errors=True)
+        return output_path
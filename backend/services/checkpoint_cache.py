@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import pandas as pd
+import requests
+import streamlit as st
+
+from backend.services.backend_api_client import BackendAPIClient
+from backend.services.payload_codecs import decode_table
+from backend.services.request_policy import BackendAPIUnavailable
+from backend.utils.json_table_reader import read_json_table
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+CHECKPOINT_TABLES = ["executors", "orders", "trade_fill", "controllers"]
+MANIFEST_FILE = "manifest.json"
+# Columns of each table read by the dashboard, None keeps every column. The executors keep the ExecutorInfo fields,
+# and the trade fills drop the strategy config path and the JSON encoded fee, which are never displayed.
+DEFAULT_CHECKPOINT_COLUMNS = {
+    "executors": ["id", "timestamp", "type", "close_type", "close_timestamp", "status", "config", "net_pnl_pct",
+                  "net_pnl_quote", "cum_fees_quote", "filled_amount_quote", "is_active", "is_trading",
+                  "custom_info", "controller_id"],
+    "orders": None,
+    "trade_fill": ["market", "symbol", "base_asset", "quote_asset", "timestamp", "order_id", "trade_type",
+                   "order_type", "price", "amount", "leverage", "trade_fee_in_quote", "exchange_trade_id", "position"],
+    "controllers": None,
+}
+
+
+def decode_checkpoint_table(table, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a table of a load-checkpoint response, sent either as a JSON string or as an encoded table.
+    :param table:
+    :param columns: Columns to keep, or None to keep all of them.
+    :return:
+    """
+    if isinstance(table, str):
+        return read_json_table(table, columns)
+    table = decode_table(table)
+    return table[[column for column in columns if column in table.columns]] if columns is not None else table
+
+
+class CheckpointCache:
+    """
+    On-disk cache of loaded checkpoints. Every table of a checkpoint is stored as an uncompressed Arrow IPC file in a
+    directory keyed by the checkpoint path and the hash of the load-checkpoint response, and is read back through a
+    memory map instead of decoding the JSON tables again.
+
+    A cached copy fetched less than `ttl` seconds ago is served without contacting the backend. Past that, the
+    checkpoint is downloaded again and the cached tables are kept when the body has the same hash, so only the
+    download is repeated. When the backend can't be reached, the cached tables are served as they are. A checkpoint
+    re-created under the same path must be dropped with `invalidate` to be seen before the TTL expires. Without
+    pyarrow the cache is disabled and checkpoints are decoded on every load.
+
+    Only the `columns` of each table are kept, and changing them invalidates the cached copy.
+    """
+
+    def __init__(self, backend_api_client: BackendAPIClient, cache_dir: str,
+                 columns: Optional[Dict[str, Optional[List[str]]]] = None, ttl: float = 300):
+        self.backend_api_client = backend_api_client
+        self.cache_dir = cache_dir
+        self.columns = {**DEFAULT_CHECKPOINT_COLUMNS, **(columns or {})}
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return pa is not None
+
+    def load(self, checkpoint_path: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Load the tables of a checkpoint, from disk when the cached copy is up to date.
+        :param checkpoint_path: Path of the checkpoint in the backend.
+        :return: The checkpoint tables by name, or None when the backend returned an error.
+        """
+        entry_dir = self._entry_dir(checkpoint_path)
+        manifest = self._read_manifest(entry_dir) if self.enabled else None
+        if manifest is not None and manifest.get("columns") != self.columns:
+            manifest = None
+        if manifest is not None and time.time() - manifest.get("fetched_at", 0) < self.ttl:
+            return self._read_tables(entry_dir, manifest)
+        try:
+            response = self.backend_api_client.load_checkpoint_response(checkpoint_path)
+        except (BackendAPIUnavailable, requests.ConnectionError, requests.Timeout):
+            if manifest is None:
+                raise
+            return self._read_tables(entry_dir, manifest)
+        if response.status_code != 200:
+            return self.backend_api_client._process_response(response)
+
+        response_hash = hashlib.sha256(response.content).hexdigest()
+        if manifest is not None and manifest["content_hash"] == response_hash:
+            self._write_manifest(entry_dir, {**manifest, "fetched_at": time.time()})
+            return self._read_tables(entry_dir, manifest)
+        checkpoint_data = response.json()
+        del response
+        tables = {}
+        for table in CHECKPOINT_TABLES:
+            # Drop each JSON string once decoded, so at most one of them is alive next to the decoded tables.
+            tables[table] = decode_checkpoint_table(checkpoint_data.pop(table), self.columns[table])
+        if not self.enabled:
+            return tables
+        try:
+            manifest = self._write_entry(entry_dir, checkpoint_path, response_hash, self.columns, tables)
+        except (pa.ArrowException, OSError) as e:
+            st.warning(f"Could not cache checkpoint {checkpoint_path} on disk: {e}")
+            return tables
+        return self._read_tables(entry_dir, manifest)
+
+    def invalidate(self, checkpoint_path: Optional[str] = None):
+        """
+        Drop the cached copy of a checkpoint, or of every checkpoint when no path is given, so the next load
+        downloads it again.
+        """
+        if checkpoint_path is None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+        else:
+            shutil.rmtree(self._entry_dir(checkpoint_path), ignore_errors=True)
+
+    def _entry_dir(self, checkpoint_path: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(checkpoint_path.encode()).hexdigest()[:32])
+
+    @staticmethod
+    def _read_manifest(entry_dir: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(entry_dir, MANIFEST_FILE)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        tables_dir = os.path.join(entry_dir, manifest["content_hash"])
+        if not all(os.path.exists(os.path.join(tables_dir, f"{table}.arrow")) for table in CHECKPOINT_TABLES):
+            return None
+        return manifest
+
+    @staticmethod
+    def _read_tables(entry_dir: str, manifest: dict) -> Dict[str, pd.DataFrame]:
+        tables_dir = os.path.join(entry_dir, manifest["content_hash"])
+        tables = {}
+        for table in CHECKPOINT_TABLES:
+            with pa.memory_map(os.path.join(tables_dir, f"{table}.arrow")) as source:
+                tables[table] = pa.ipc.open_file(source).read_all().to_pandas()
+        return tables
+
+    @staticmethod
+    def _encode_json_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store nested values, like decoded executor configs, as JSON strings. The data source decodes JSON columns
+        when it loads them.
+        """
+        nested_columns = [column for column in df.columns if df[column].dtype == object and
+                          df[column].map(lambda value: isinstance(value, (dict, list))).any()]
+        if not nested_columns:
+            return df
+        df = df.copy()
+        for column in nested_columns:
+            df[column] = df[column].map(lambda value: json.dumps(value) if isinstance(value, (dict, list)) else value)
+        return df
+
+    @staticmethod
+    def _write_entry(entry_dir: str, checkpoint_path: str, content_hash: str,
+                     columns: Dict[str, Optional[List[str]]], tables: Dict[str, pd.DataFrame]) -> dict:
+        """
+        Write the tables in a directory named after the content hash and point the manifest to it. Both are written
+        under temporary names and renamed once complete, so concurrent readers only see finished entries.
+        """
+        os.makedirs(entry_dir, exist_ok=True)
+        tables_dir = os.path.join(entry_dir, content_hash)
+        tmp_dir = f"{tables_dir}.tmp-{uuid.uuid4().hex}"
+        os.makedirs(tmp_dir)
+        try:
+            for table, df in tables.items():
+                arrow_table = pa.Table.from_pandas(CheckpointCache._encode_json_columns(df), preserve_index=False)
+                with pa.OSFile(os.path.join(tmp_dir, f"{table}.arrow"), "wb") as sink:
+                    with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                        writer.write_table(arrow_table)
+            if os.path.exists(tables_dir):
+                shutil.rmtree(tmp_dir)
+            else:
+                os.replace(tmp_dir, tables_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        manifest = {"checkpoint_path": checkpoint_path, "content_hash": content_hash, "columns": columns,
+                    "fetched_at": time.time()}
+        CheckpointCache._write_manifest(entry_dir, manifest)
+        for name in os.listdir(entry_dir):
+            if name not in (MANIFEST_FILE, content_hash) and ".tmp-" not in name:
+                shutil.rmtree(os.path.join(entry_dir, name), ignore_errors=True)
+        return manifest
+
+    @staticmethod
+    def _write_manifest(entry_dir: str, manifest: dict):
+        tmp_manifest = os.path.join(entry_dir, f"{MANIFEST_FILE}.tmp-{uuid.uuid4().hex}")
+        with open(tmp_manifest, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_manifest, os.path.join(entry_dir, MANIFEST_FILE))
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Optional
+
+from backend.services.backend_api_client import BackendAPIClient
+
+
+class DockerStatusMonitor:
+    """
+    Keeps the last known Docker status of the Backend API in memory and refreshes it from a background thread, so
+    callers can read it without paying a round trip. A failed probe keeps the previous status until it gets older
+    than `stale_after` seconds. Probes are single requests bounded by `probe_timeout`, without the retries of the
+    client policy, so a dead backend is reported within `stale_after` seconds.
+    """
+
+    def __init__(self, backend_api_client: BackendAPIClient, refresh_interval: float = 5, stale_after: float = 30,
+                 probe_timeout: float = 2):
+        self.backend_api_client = backend_api_client
+        self.refresh_interval = refresh_interval
+        self.stale_after = stale_after
+        self.probe_timeout = probe_timeout
+        self._is_docker_running: Optional[bool] = None
+        self._last_update: float = 0
+        self._last_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the background refresher, which probes the Backend API right away."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._refresh_loop, name="docker-status-monitor", daemon=True)
+            self._thread.start()
+
+    def probe(self):
+        """Query the Backend API once and update the cached status."""
+        try:
+            is_docker_running = bool(self.backend_api_client.is_docker_running(timeout=self.probe_timeout))
+        except Exception as e:
+            self._last_error = e
+            return
+        self._is_docker_running = is_docker_running
+        self._last_update = time.time()
+        self._last_error = None
+
+    def _refresh_loop(self):
+        while True:
+            self.probe()
+            time.sleep(self.refresh_interval)
+
+    @property
+    def has_status(self) -> bool:
+        """Whether a probe completed, successfully or not."""
+        return self._last_update > 0 or self._last_error is not None
+
+    @property
+    def is_docker_running(self) -> Optional[bool]:
+        return self._is_docker_running
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() - self._last_update > self.stale_after
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        return self._last_error
@@ -0,0 +1,90 @@
+import base64
+import io
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from urllib3.util.request import ACCEPT_ENCODING as SUPPORTED_ENCODINGS
+
+from backend.utils.executor_records import build_executor_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+TABLE_FORMAT_HEADER = "X-Table-Format"
+
+# urllib3 lists the encodings it can decode in this environment: gzip and deflate, plus br and zstd when the optional
+# brotli and zstandard packages are installed.
+ACCEPT_ENCODING = SUPPORTED_ENCODINGS
+BINARY_TABLES_AVAILABLE = pa is not None
+
+
+def table_request_headers() -> dict:
+    """
+    Headers that let the backend answer with binary tables when pyarrow is installed. Table endpoints may then send
+    an Arrow IPC stream or Parquet body, and envelope endpoints may encode their tables as described in `decode_table`.
+    """
+    if not BINARY_TABLES_AVAILABLE:
+        return {}
+    return {
+        "Accept": f"{ARROW_STREAM_MEDIA_TYPE}, {PARQUET_MEDIA_TYPE};q=0.9, application/json;q=0.5",
+        TABLE_FORMAT_HEADER: "arrow, parquet",
+    }
+
+
+def is_binary_table_response(content_type: str) -> bool:
+    return content_type.startswith(ARROW_STREAM_MEDIA_TYPE) or content_type.startswith(PARQUET_MEDIA_TYPE)
+
+
+def read_binary_table(content: bytes, content_type: str) -> pd.DataFrame:
+    """Decode an Arrow IPC stream or Parquet body straight into a DataFrame."""
+    if content_type.startswith(PARQUET_MEDIA_TYPE):
+        return pq.read_table(io.BytesIO(content)).to_pandas()
+    with pa.ipc.open_stream(pa.py_buffer(content)) as reader:
+        return reader.read_pandas()
+
+
+def decode_table(value: Any) -> pd.DataFrame:
+    """
+    Build a DataFrame from a table field of a JSON response. The field is either a plain list of records, or, when
+    the backend honours the X-Table-Format header, an object like {"format": "arrow", "data": "<base64>"} holding an
+    Arrow IPC stream or Parquet file.
+    """
+    if isinstance(value, dict) and value.get("format") in ("arrow", "parquet"):
+        content_type = ARROW_STREAM_MEDIA_TYPE if value["format"] == "arrow" else PARQUET_MEDIA_TYPE
+        return read_binary_table(base64.b64decode(value["data"]), content_type)
+    return pd.DataFrame(value)
+
+
+def decode_results(endpoint: str, results: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Decode the processed data and executors of a run-backtesting or get-performance-results response, as returned by
+    the `_post_with_tables` method of the Backend API clients.
+
+    Raises:
+    - Exception: If the backend returned an error, with its message.
+    """
+    if results is None:
+        raise Exception(f"Backend API returned an error for {endpoint}.")
+    if "error" in results:
+        raise Exception(results["error"])
+    if "detail" in results:
+        raise Exception(results["detail"])
+    if "processed_data" not in results:
+        data = None
+    else:
+        data = decode_table(results["processed_data"])
+    if "executors" not in results:
+        executors = []
+    else:
+        executors = build_executor_records(results["executors"])
+    return {
+        "processed_data": data,
+        "executors": executors,
+        "results": results["results"]
+    }
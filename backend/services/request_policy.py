@@ -0,0 +1,104 @@
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class BackendAPIUnavailable(Exception):
+    """Raised without hitting the network while the circuit breaker considers the Backend API unhealthy."""
+
+
+class RequestPolicy:
+    """
+    Timeout, retry and circuit breaker policy shared by every request of a BackendAPIClient.
+
+    - Timeouts are (connect, read) tuples. The read timeout can be overridden per endpoint, matched on the first path
+      segment, so slow endpoints like backtesting don't force a long timeout on everything else.
+    - Idempotent requests are retried on connection errors, timeouts and 5xx responses with a full-jitter exponential
+      backoff.
+    - After `failure_threshold` consecutive failed requests the circuit opens and requests fail fast with
+      BackendAPIUnavailable. After `reset_timeout` seconds a single trial request is let through and closes the circuit
+      again if it succeeds.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    DEFAULT_READ_TIMEOUTS = {
+        "run-backtesting": 900,
+        "get-performance-results": 300,
+        "historical-candles": 300,
+        "load-checkpoint": 300,
+        "create-checkpoint": 300,
+        "pull-image": 600,
+    }
+
+    def __init__(self, connect_timeout: float = 3.05, read_timeout: Optional[float] = 30,
+                 read_timeouts: Optional[Dict[str, Optional[float]]] = None, max_retries: int = 3,
+                 backoff_base: float = 0.25, backoff_max: float = 4, failure_threshold: int = 5,
+                 reset_timeout: float = 15):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.read_timeouts = {**self.DEFAULT_READ_TIMEOUTS, **(read_timeouts or {})}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "failures": 0, "retries": 0, "circuit_trips": 0, "short_circuited": 0}
+
+    def timeout_for(self, endpoint: str) -> Tuple[float, Optional[float]]:
+        route = endpoint.split("/", 1)[0]
+        return self.connect_timeout, self.read_timeouts.get(route, self.read_timeout)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.time() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_request(self):
+        """Raise BackendAPIUnavailable if the circuit is open, otherwise register the request."""
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.time() - self._opened_at < self.reset_timeout:
+                    self._counters["short_circuited"] += 1
+                    raise BackendAPIUnavailable("Backend API is unavailable, retrying in a few seconds.")
+                # Let this request through as the trial; the others keep failing fast until it completes.
+                self._state = self.HALF_OPEN
+            elif self._state == self.HALF_OPEN:
+                self._counters["short_circuited"] += 1
+                raise BackendAPIUnavailable("Backend API is unavailable, retrying in a few seconds.")
+            self._counters["requests"] += 1
+
+    def record_retry(self):
+        with self._lock:
+            self._counters["retries"] += 1
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._counters["failures"] += 1
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._counters["circuit_trips"] += 1
+                self._state = self.OPEN
+                self._opened_at = time.time()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
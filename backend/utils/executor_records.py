@@ -0,0 +1,172 @@
+import json
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+REQUIRED_COLUMNS = ["id", "timestamp", "type", "status", "config", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote",
+                    "filled_amount_quote", "is_active", "is_trading", "custom_info"]
+NUMERIC_COLUMNS = ["timestamp", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote", "filled_amount_quote"]
+
+
+class ExecutorConfigView(dict):
+    """Executor config dict that also exposes its keys as attributes, like the typed executor config models."""
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class ExecutorRecord:
+    """
+    Lightweight stand-in for ExecutorInfo exposing the same attributes, built by `build_executor_records` from columns
+    validated once for the whole batch instead of running the pydantic model on every executor. Amounts are floats.
+    """
+    __slots__ = ("id", "timestamp", "type", "status", "config", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote",
+                 "filled_amount_quote", "is_active", "is_trading", "custom_info", "close_timestamp", "close_type",
+                 "controller_id")
+
+    def __init__(self, id: str, timestamp: float, type: str, status: RunnableStatus, config: ExecutorConfigView,
+                 net_pnl_pct: float, net_pnl_quote: float, cum_fees_quote: float, filled_amount_quote: float,
+                 is_active: bool, is_trading: bool, custom_info: Dict, close_timestamp: Optional[float] = None,
+                 close_type: Optional[CloseType] = None, controller_id: Optional[str] = None):
+        self.id = id
+        self.timestamp = timestamp
+        self.type = type
+        self.status = status
+        self.config = config
+        self.net_pnl_pct = net_pnl_pct
+        self.net_pnl_quote = net_pnl_quote
+        self.cum_fees_quote = cum_fees_quote
+        self.filled_amount_quote = filled_amount_quote
+        self.is_active = is_active
+        self.is_trading = is_trading
+        self.custom_info = custom_info
+        self.close_timestamp = close_timestamp
+        self.close_type = close_type
+        self.controller_id = controller_id
+
+    @property
+    def is_done(self):
+        return self.status == RunnableStatus.TERMINATED
+
+    @property
+    def side(self) -> Optional[TradeType]:
+        return self.custom_info.get("side", None)
+
+    @property
+    def trading_pair(self) -> Optional[str]:
+        return self.config.get("trading_pair")
+
+    @property
+    def connector_name(self) -> Optional[str]:
+        return self.config.get("connector_name")
+
+    def to_dict(self):
+        base_dict = {field: getattr(self, field) for field in self.__slots__}
+        base_dict["config"] = dict(self.config)
+        base_dict["side"] = self.side
+        return base_dict
+
+    def __repr__(self):
+        return f"ExecutorRecord(id={self.id!r}, type={self.type!r}, status={self.status!r})"
+
+
+def to_enum_members(values: pd.Series, enum_class, column: str) -> pd.Series:
+    """
+    Map a column holding enum values or members to members with a single lookup table.
+
+    Raises:
+    - ValueError: If a non null value doesn't belong to the enum.
+    """
+    lookup = {member.value: member for member in enum_class}
+    lookup.update({member: member for member in enum_class})
+    members = values.map(lookup)
+    unknown = members.isna() & values.notna()
+    if unknown.any():
+        raise ValueError(f"Invalid {column} {values[unknown].iloc[0]!r}, expected a {enum_class.__name__} value")
+    return members.astype(object).where(members.notna(), None)
+
+
+def to_enum_categorical(values: pd.Series, enum_class, column: str) -> pd.Series:
+    """
+    Encode a column holding enum values or members as a categorical whose categories are the members of the enum, in
+    definition order. Rows only store a small integer code, and the members are materialized once per category.
+
+    Raises:
+    - ValueError: If a non null value doesn't belong to the enum.
+    """
+    members = list(enum_class)
+    if isinstance(values.dtype, pd.CategoricalDtype) and list(values.cat.categories) == members:
+        return values
+    codes = pd.Series(range(len(members)), index=[member.value for member in members])
+    codes = pd.concat([codes, pd.Series(range(len(members)), index=members)])
+    positions = values.map(codes)
+    unknown = positions.isna() & values.notna()
+    if unknown.any():
+        raise ValueError(f"Invalid {column} {values[unknown].iloc[0]!r}, expected a {enum_class.__name__} value")
+    return pd.Series(pd.Categorical.from_codes(positions.fillna(-1).astype(np.int8), categories=members),
+                     index=values.index, name=values.name)
+
+
+def from_enum_categorical(values: pd.Series) -> pd.Series:
+    """Enum values of a column of enum members, converting each category once when the column is categorical."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.rename_categories([member.value for member in values.cat.categories]).astype(object)
+    return values.map(lambda member: member.value)
+
+
+def _parse_json_objects(values: pd.Series, column: str) -> List[dict]:
+    parsed = [json.loads(value) if isinstance(value, str) else value for value in values.tolist()]
+    if not all(isinstance(value, dict) for value in parsed):
+        raise ValueError(f"Every executor {column} must be a JSON object")
+    return parsed
+
+
+def build_executor_records(executors: Union[pd.DataFrame, List[Dict[str, Any]]]) -> List[ExecutorRecord]:
+    """
+    Build executor records from a frame or a list of executor dicts. Each column is validated and converted once:
+    required fields, numbers, enums and JSON fields. The config side is exposed as a TradeType member.
+
+    Raises:
+    - ValueError: If a required column is missing or a value can't be converted.
+    """
+    executors_df = executors if isinstance(executors, pd.DataFrame) else pd.DataFrame(executors)
+    if executors_df.empty:
+        return []
+    missing_columns = [column for column in REQUIRED_COLUMNS if column not in executors_df.columns]
+    if missing_columns:
+        raise ValueError(f"Executors are missing the columns {missing_columns}")
+
+    columns = {}
+    for column in NUMERIC_COLUMNS:
+        columns[column] = pd.to_numeric(executors_df[column], errors="raise").astype(float).tolist()
+    if "close_timestamp" in executors_df.columns:
+        close_timestamps = pd.to_numeric(executors_df["close_timestamp"], errors="raise").astype(float)
+        columns["close_timestamp"] = close_timestamps.astype(object).where(close_timestamps.notna(), None).tolist()
+    columns["status"] = to_enum_members(executors_df["status"], RunnableStatus, "status").tolist()
+    if "close_type" in executors_df.columns:
+        columns["close_type"] = to_enum_members(executors_df["close_type"], CloseType, "close_type").tolist()
+    columns["custom_info"] = _parse_json_objects(executors_df["custom_info"], "custom_info")
+
+    configs = _parse_json_objects(executors_df["config"], "config")
+    sides = to_enum_members(pd.Series([config.get("side") for config in configs], dtype=object), TradeType, "side")
+    columns["config"] = [ExecutorConfigView(config, side=side) if side is not None else ExecutorConfigView(config)
+                         for config, side in zip(configs, sides.tolist())]
+
+    for column in ["id", "type"]:
+        columns[column] = executors_df[column].astype(str).tolist()
+    for column in ["is_active", "is_trading"]:
+        columns[column] = executors_df[column].astype(bool).tolist()
+    if "controller_id" in executors_df.columns:
+        controller_ids = executors_df["controller_id"].astype(object)
+        columns["controller_id"] = controller_ids.where(controller_ids.notna(), None).tolist()
+
+    fields = list(columns)
+    return [ExecutorRecord(**dict(zip(fields, values))) for values in zip(*columns.values())]
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class ExecutorsFilterIndex:
+    """
+    Query engine over an executors frame sorted by close_timestamp, with the same semantics as
+    PerformanceDataSource.filter_executors:
+
+    - list values keep the rows whose column is in the list (empty lists are ignored),
+    - start_time keeps the rows opened at or after start_time - 60,
+    - end_time keeps the rows closed at or before end_time + 60,
+    - a scalar close_type_name keeps the rows with that close type.
+
+    Every filtered column is factorized once into integer codes with a posting list of row positions per code, so a
+    list filter costs O(matches). Time filters narrow the row range with a binary search on close_timestamp. The row
+    positions of the most recent filters are memoized.
+    """
+
+    def __init__(self, executors_df: pd.DataFrame, max_cached_filters: int = 64):
+        self.executors_df = executors_df
+        self.max_cached_filters = max_cached_filters
+        self._close_timestamps = executors_df["close_timestamp"].to_numpy()
+        self._timestamps = executors_df["timestamp"].to_numpy()
+        self._is_sorted = bool(np.all(np.diff(self._close_timestamps) >= 0))
+        self._closes_after_open = bool(np.all(self._close_timestamps >= self._timestamps))
+        self._postings: Dict[str, tuple] = {}
+        self._cached_filters: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+    def filter(self, filters: Dict[str, Any]) -> pd.DataFrame:
+        return self.executors_df.take(self.positions(filters))
+
+    def positions(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Sorted row positions of the executors matching the filters."""
+        key = self._filter_key(filters)
+        if key in self._cached_filters:
+            self._cached_filters.move_to_end(key)
+            return self._cached_filters[key]
+        positions = self._compute_positions(filters)
+        positions.setflags(write=False)
+        self._cached_filters[key] = positions
+        if len(self._cached_filters) > self.max_cached_filters:
+            self._cached_filters.popitem(last=False)
+        return positions
+
+    @staticmethod
+    def _filter_key(filters: Dict[str, Any]) -> tuple:
+        return tuple(sorted((key, tuple(value) if isinstance(value, list) else value)
+                            for key, value in filters.items()))
+
+    def _compute_positions(self, filters: Dict[str, Any]) -> np.ndarray:
+        lower, upper = 0, len(self.executors_df)
+        if self._is_sorted and "end_time" in filters:
+            upper = np.searchsorted(self._close_timestamps, filters["end_time"] + 60, side="right")
+        if self._is_sorted and self._closes_after_open and "start_time" in filters:
+            # An executor closes after it opens, so its close_timestamp bounds the search from below.
+            lower = np.searchsorted(self._close_timestamps, filters["start_time"] - 60, side="left")
+        mask = np.zeros(len(self.executors_df), dtype=bool)
+        mask[lower:upper] = True
+        if "start_time" in filters:
+            mask[lower:upper] &= self._timestamps[lower:upper] >= filters["start_time"] - 60
+        if not self._is_sorted and "end_time" in filters:
+            mask &= self._close_timestamps <= filters["end_time"] + 60
+
+        for key, value in filters.items():
+            if isinstance(value, list) and len(value) > 0:
+                mask &= self._isin_mask(key, value)
+            elif key == "close_type_name" and not isinstance(value, list):
+                mask &= self._isin_mask(key, [value])
+        return np.flatnonzero(mask)
+
+    def _isin_mask(self, column: str, values: List[Any]) -> np.ndarray:
+        uniques, order, offsets = self._get_postings(column)
+        codes = uniques.get_indexer(pd.Index(values, dtype=object).unique())
+        mask = np.zeros(len(self.executors_df), dtype=bool)
+        for code in codes[codes >= 0]:
+            mask[order[offsets[code]:offsets[code + 1]]] = True
+        return mask
+
+    def _get_postings(self, column: str) -> tuple:
+        if column not in self._postings:
+            codes, uniques = pd.factorize(self.executors_df[column], use_na_sentinel=False)
+            order = np.argsort(codes, kind="stable")
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(uniques)))])
+            self._postings[column] = (pd.Index(uniques, dtype=object), order, offsets)
+        return self._postings[column]
@@ -0,0 +1,141 @@
+from itertools import chain
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+COMPLETED_ORDER_STATUSES = ["SellOrderCompleted", "BuyOrderCompleted"]
+EXECUTORS_WITH_ORDERS_COLUMNS = ["executor_id", "order_id", "last_status", "last_update_timestamp", "price", "amount",
+                                 "position"]
+
+
+class ExecutorsOrdersIndex:
+    """
+    Join between executors and their completed orders, without exploding the order ids of the executors.
+
+    - Completed orders are kept in `completed_orders`, one row per client_order_id, and every order id referenced by
+      an executor gets an integer code through a hash index. `order_rows[code]` is the row of the completed order, or
+      -1 while the order is unknown or not completed.
+    - The order ids of the executors are stored CSR style: the codes of executor i are
+      `order_codes[offsets[i]:offsets[i + 1]]`.
+
+    Looking up the orders of an executor, or aggregating its fills, costs O(its orders), and new executors and updated
+    orders are added without touching the existing links. Executors that are added again replace their previous
+    version. An updated order is appended to `completed_orders` and its previous row is left behind, so the frame is
+    compacted down to the linked rows once more than half of its rows are stale.
+    """
+
+    def __init__(self, executor_ids: Sequence[str], order_ids: Sequence[List[str]], orders: pd.DataFrame):
+        self.completed_orders = self._completed(orders).reset_index(drop=True)
+        self.executor_ids = np.empty(0, dtype=object)
+        self.is_alive = np.empty(0, dtype=bool)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.order_codes = np.empty(0, dtype=np.int64)
+        self.order_id_index = pd.Index(self.completed_orders["client_order_id"], dtype=object)
+        self.order_rows = np.arange(len(self.completed_orders), dtype=np.int64)
+        self._executor_positions = {}
+        self.add_executors(executor_ids, order_ids)
+
+    @staticmethod
+    def _completed(orders: pd.DataFrame) -> pd.DataFrame:
+        if orders.empty or "last_status" not in orders.columns:
+            return pd.DataFrame(columns=["client_order_id", *EXECUTORS_WITH_ORDERS_COLUMNS[2:]])
+        completed = orders[orders["last_status"].isin(COMPLETED_ORDER_STATUSES)]
+        return completed.drop_duplicates(subset="client_order_id", keep="last")
+
+    def _codes_of(self, order_ids: Sequence[str]) -> np.ndarray:
+        """Codes of the order ids, registering the ones seen for the first time."""
+        order_ids = pd.Index(order_ids, dtype=object)
+        codes = self.order_id_index.get_indexer(order_ids)
+        is_new = codes < 0
+        if is_new.any():
+            new_ids = order_ids[is_new].unique()
+            self.order_id_index = self.order_id_index.append(new_ids)
+            self.order_rows = np.concatenate([self.order_rows, np.full(len(new_ids), -1, dtype=np.int64)])
+            codes[is_new] = self.order_id_index.get_indexer(order_ids[is_new])
+        return codes
+
+    def add_executors(self, executor_ids: Sequence[str], order_ids: Sequence[List[str]]):
+        """
+        Add executors with the order ids of each one.
+        :param executor_ids:
+        :param order_ids: List of order ids per executor, None when it has none.
+        :return:
+        """
+        executor_ids = np.asarray(executor_ids, dtype=object)
+        order_ids = [ids if isinstance(ids, list) else [] for ids in order_ids]
+        lengths = np.fromiter((len(ids) for ids in order_ids), dtype=np.int64, count=len(order_ids))
+        codes = self._codes_of(list(chain.from_iterable(order_ids)))
+
+        for executor_id in executor_ids:
+            position = self._executor_positions.get(executor_id)
+            if position is not None:
+                self.is_alive[position] = False
+        start = len(self.executor_ids)
+        self._executor_positions.update(zip(executor_ids.tolist(), range(start, start + len(executor_ids))))
+        self.executor_ids = np.concatenate([self.executor_ids, executor_ids])
+        self.is_alive = np.concatenate([self.is_alive, np.ones(len(executor_ids), dtype=bool)])
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.cumsum(lengths)])
+        self.order_codes = np.concatenate([self.order_codes, codes])
+
+    def update_orders(self, orders: pd.DataFrame):
+        """Register new or updated orders. Orders that are no longer completed are unlinked."""
+        if orders.empty:
+            return
+        codes = self._codes_of(orders["client_order_id"].unique())
+        self.order_rows[codes] = -1
+        completed = self._completed(orders)
+        if completed.empty:
+            return
+        start = len(self.completed_orders)
+        self.completed_orders = pd.concat([self.completed_orders, completed], ignore_index=True)
+        self.order_rows[self.order_id_index.get_indexer(completed["client_order_id"])] = np.arange(
+            start, start + len(completed))
+        if len(self.completed_orders) > 2 * np.count_nonzero(self.order_rows >= 0):
+            self._compact_completed_orders()
+
+    def _compact_completed_orders(self):
+        """Drop the rows of `completed_orders` that no order code points to anymore."""
+        codes = np.flatnonzero(self.order_rows >= 0)
+        codes = codes[np.argsort(self.order_rows[codes], kind="stable")]
+        self.completed_orders = self.completed_orders.take(self.order_rows[codes]).reset_index(drop=True)
+        self.order_rows[codes] = np.arange(len(codes))
+
+    def _rows_of(self, executor_id: str) -> np.ndarray:
+        """Rows of `completed_orders` of an executor, in the order of its order ids."""
+        position = self._executor_positions[executor_id]
+        rows = self.order_rows[self.order_codes[self.offsets[position]:self.offsets[position + 1]]]
+        return rows[rows >= 0]
+
+    def orders_of(self, executor_id: str) -> pd.DataFrame:
+        """Completed orders of an executor, in the order of its order ids."""
+        return self.completed_orders.take(self._rows_of(executor_id))
+
+    def order_aggregates(self, executor_id: str) -> Dict[str, float]:
+        """Number of completed orders, filled amount, filled quote and average price of an executor."""
+        orders = self.orders_of(executor_id)
+        price = pd.to_numeric(orders["price"], errors="coerce").to_numpy(dtype=float)
+        amount = pd.to_numeric(orders["amount"], errors="coerce").to_numpy(dtype=float)
+        filled_amount = float(amount.sum())
+        filled_quote = float((price * amount).sum())
+        return {
+            "orders_count": len(orders),
+            "filled_amount": filled_amount,
+            "filled_quote": filled_quote,
+            "average_price": filled_quote / filled_amount if filled_amount != 0 else np.nan,
+        }
+
+    def _links(self):
+        """Executor position and completed order row of every executor to completed order link."""
+        link_executors = np.repeat(np.arange(len(self.executor_ids)), np.diff(self.offsets))
+        link_rows = self.order_rows[self.order_codes]
+        is_linked = (link_rows >= 0) & self.is_alive[link_executors]
+        return link_executors[is_linked], link_rows[is_linked]
+
+    def executors_with_orders(self) -> pd.DataFrame:
+        """One row per executor and completed order, like a merge of the exploded order ids with the orders."""
+        link_executors, link_rows = self._links()
+        orders = self.completed_orders.take(link_rows).reset_index(drop=True)
+        orders.insert(0, "executor_id", self.executor_ids[link_executors])
+        orders["order_id"] = orders["client_order_id"]
+        return orders[EXECUTORS_WITH_ORDERS_COLUMNS]
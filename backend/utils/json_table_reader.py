@@ -0,0 +1,109 @@
+import json
+import math
+import re
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def iter_json_records(text: str) -> Iterator[Any]:
+    """
+    Decode the records of a JSON array, or of newline delimited JSON, one at a time, so only a single decoded record
+    is alive at once.
+    """
+    position = _SEPARATORS.match(text).end()
+    is_array = text.startswith("[", position)
+    if is_array:
+        position += 1
+    while True:
+        position = _SEPARATORS.match(text, position).end()
+        if position == len(text) or (is_array and text[position] == "]"):
+            return
+        record, position = _DECODER.raw_decode(text, position)
+        yield record
+
+
+class _ColumnBuffer:
+    """
+    Values of a column, packed in a typed array while they are all integers, or integers, floats and nulls, and kept
+    in a list from the first value of another type on. The dtypes match what pandas infers from the same values.
+    """
+    __slots__ = ("values",)
+
+    def __init__(self, missing_rows: int = 0):
+        self.values = array("d", [math.nan]) * missing_rows if missing_rows else array("q")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: Any):
+        values = self.values
+        if isinstance(values, list):
+            values.append(value)
+        elif value is None or type(value) is float:
+            if values.typecode == "q":
+                values = self.values = array("d", values)
+            values.append(math.nan if value is None else value)
+        elif type(value) is int:
+            try:
+                values.append(value)
+            except OverflowError:
+                self.values = values.tolist()
+                self.values.append(value)
+        else:
+            self.values = values.tolist()
+            self.values.append(value)
+
+    def pad(self, rows: int):
+        """Append nulls until the column has `rows` values."""
+        while len(self.values) < rows:
+            self.append(None)
+
+    def column(self):
+        """The values as a NumPy array, or as a list for pandas to infer their dtype."""
+        if isinstance(self.values, list):
+            return self.values
+        return np.frombuffer(self.values, dtype=self.values.typecode)
+
+
+def read_json_table(text: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Build a DataFrame from a JSON table without materializing the list of records: every record is decoded on its
+    own and its values are appended to one buffer per column, and the fields outside of `columns` are dropped right
+    away. Numeric columns are packed in typed arrays as they are read. Column oriented tables, like the output of
+    DataFrame.to_dict(), are decoded in one go.
+    :param text: A JSON array of records, newline delimited JSON records, or a JSON object of columns.
+    :param columns: Columns to keep, or None to keep all of them. Missing columns are skipped.
+    :return:
+    """
+    start = _SEPARATORS.match(text).end()
+    if text.startswith("{", start):
+        first_record, end = _DECODER.raw_decode(text, start)
+        if _SEPARATORS.match(text, end).end() == len(text) and all(isinstance(value, dict) for value in first_record.values()):
+            table = pd.DataFrame(first_record)
+            return table[[column for column in columns if column in table.columns]] if columns is not None else table
+
+    wanted = set(columns) if columns is not None else None
+    buffers: Dict[str, _ColumnBuffer] = {}
+    rows = 0
+    for record in iter_json_records(text):
+        kept = 0
+        for column, value in record.items():
+            buffer = buffers.get(column)
+            if buffer is None:
+                if wanted is not None and column not in wanted:
+                    continue
+                buffer = buffers[column] = _ColumnBuffer(missing_rows=rows)
+            buffer.append(value)
+            kept += 1
+        rows += 1
+        if kept != len(buffers):
+            # The record lacks some of the columns, which are filled with nulls.
+            for buffer in buffers.values():
+                buffer.pad(rows)
+    return pd.DataFrame({column: buffer.column() for column, buffer in buffers.items()}, index=pd.RangeIndex(rows))
@@ -1,22 +1,38 @@
+import hashlib
 import json
-from typing import Any, Dict, List
+from enum import Enum
+from functools import cached_property
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+from backend.utils.executor_records import ExecutorRecord, build_executor_records, from_enum_categorical, to_enum_categorical
+from backend.utils.executors_filter_index import ExecutorsFilterIndex
+from backend.utils.executors_orders_index import ExecutorsOrdersIndex
+from backend.utils.timestamps import timestamps_to_seconds
 
 
 class PerformanceDataSource:
+    TRADE_FILL_KEY_COLUMNS = ["market", "order_id", "exchange_trade_id"]
+    FINGERPRINT_COLUMNS = ["id", "controller_id", "close_timestamp", "net_pnl_quote", "filled_amount_quote"]
+
     def __init__(self,
-                 checkpoint_data: Dict[str, Any]):
-        self.checkpoint_data = checkpoint_data
+                 checkpoint_data: Dict[str, Any],
+                 checkpoint_id: Optional[str] = None):
+        self.checkpoint_data = dict(checkpoint_data)
+        self.checkpoint_id = checkpoint_id
         self.executors_dict = self.checkpoint_data["executors"].copy()
         self.orders = self.load_orders()
         self.controllers_df = self.load_controllers()
-        self.executors_with_orders = self.get_executors_with_orders(self.get_executors_df(), self.orders)
+        self.watermarks = {
+            "executors": self._max_timestamp(self._executors_df["close_timestamp"]),
+            "orders": self._max_timestamp(self.orders.get("last_update_timestamp")),
+            "trade_fill": self._max_timestamp(pd.DataFrame(self.checkpoint_data["trade_fill"]).get("timestamp")),
+        }
 
     def load_orders(self):
         """
@@ -29,44 +45,210 @@ class PerformanceDataSource:
     def load_trade_fill(self):
         trade_fill = self.checkpoint_data["trade_fill"].copy()
         trade_fill = pd.DataFrame(trade_fill)
-        trade_fill["timestamp"] = trade_fill["timestamp"].apply(lambda x: self.ensure_timestamp_in_seconds(x))
+        trade_fill["timestamp"] = timestamps_to_seconds(trade_fill["timestamp"], "trade_fill timestamp")
         trade_fill["datetime"] = pd.to_datetime(trade_fill.timestamp, unit="s")
         return trade_fill
 
     def load_controllers(self):
-        controllers = self.checkpoint_data["controllers"].copy()
-        controllers = pd.DataFrame(controllers)
-        controllers["config"] = controllers["config"].apply(lambda x: json.loads(x))
+        return self._parse_controllers(pd.DataFrame(self.checkpoint_data["controllers"].copy()))
+
+    def _parse_controllers(self, controllers: pd.DataFrame) -> pd.DataFrame:
+        controllers["config"] = self.parse_json_column(controllers["config"])
+        controllers["timestamp"] = timestamps_to_seconds(controllers["timestamp"], "controllers timestamp")
         controllers["datetime"] = pd.to_datetime(controllers.timestamp, unit="s")
         return controllers
 
+    def append(self, delta: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Ingest the rows of a newer read of the same databases, for example the live databases of a running bot.
+        Only the executors, orders and trade fills at or after the watermark of their table are ingested; a row with
+        the key of an already loaded one replaces it. The derived frames are extended with the new rows instead of
+        being rebuilt, and `executors_dict` keeps the rows of the initial checkpoint.
+        :param delta: Tables by name, as lists of records or DataFrames. Missing tables are skipped.
+        :return: The number of rows ingested per table.
+        """
+        delta_tables = {table: pd.DataFrame(delta[table]) for table in
+                        ["executors", "orders", "trade_fill", "controllers"] if table in delta}
+        ingested = {}
+
+        controllers = delta_tables.get("controllers")
+        changed_controller_ids = []
+        if controllers is not None and not controllers.empty:
+            controllers = self._parse_controllers(controllers.copy())
+            changed_controller_ids = controllers["id"].tolist()
+            self.controllers_df = self._merge_rows(self.controllers_df, controllers, ["id"])
+        ingested["controllers"] = len(changed_controller_ids)
+
+        orders = self._newer_rows(delta_tables.get("orders"), "last_update_timestamp", "orders")
+        self.orders = self._merge_rows(self.orders, orders, ["client_order_id"])
+        ingested["orders"] = len(orders)
+
+        trade_fill = self._newer_rows(delta_tables.get("trade_fill"), "timestamp", "trade_fill")
+        if not trade_fill.empty:
+            current_trade_fill = pd.DataFrame(self.checkpoint_data["trade_fill"])
+            key_columns = [column for column in self.TRADE_FILL_KEY_COLUMNS if column in trade_fill.columns]
+            self.checkpoint_data["trade_fill"] = self._merge_rows(current_trade_fill, trade_fill,
+                                                                  key_columns or list(trade_fill.columns))
+        ingested["trade_fill"] = len(trade_fill)
+
+        executors = self._newer_rows(delta_tables.get("executors"), "close_timestamp", "executors")
+        if not executors.empty:
+            executors = self._parse_executors(executors.copy())
+        self._append_executors(executors, orders, changed_controller_ids)
+        ingested["executors"] = len(executors)
+        if any(ingested.values()):
+            self.__dict__.pop("fingerprint", None)
+        return ingested
+
+    def _newer_rows(self, table: pd.DataFrame, timestamp_column: str, watermark_name: str) -> pd.DataFrame:
+        """Rows of a delta table at or after the watermark, which is moved forward to the newest of them."""
+        if table is None or table.empty:
+            return pd.DataFrame()
+        timestamps = timestamps_to_seconds(table[timestamp_column], f"{watermark_name} {timestamp_column}")
+        watermark = self.watermarks[watermark_name]
+        if watermark is not None:
+            is_newer = (timestamps >= watermark).to_numpy()
+            table, timestamps = table[is_newer], timestamps[is_newer]
+        if not table.empty:
+            self.watermarks[watermark_name] = max(watermark or timestamps.max(), timestamps.max())
+        return table
+
+    @staticmethod
+    def _merge_rows(current: pd.DataFrame, new_rows: pd.DataFrame, key_columns: List[str]) -> pd.DataFrame:
+        """Append rows to a table, dropping the current rows that share their key."""
+        if new_rows.empty:
+            return current
+        if current.empty:
+            return new_rows.drop_duplicates(subset=key_columns, keep="last").reset_index(drop=True)
+        new_rows = new_rows.drop_duplicates(subset=key_columns, keep="last")
+        if len(key_columns) == 1:
+            is_replaced = current[key_columns[0]].isin(new_rows[key_columns[0]])
+        else:
+            is_replaced = pd.MultiIndex.from_frame(current[key_columns]).isin(
+                pd.MultiIndex.from_frame(new_rows[key_columns]))
+        return pd.concat([current[~np.asarray(is_replaced)], new_rows], ignore_index=True)
+
+    def _append_executors(self, executors: pd.DataFrame, orders: pd.DataFrame, changed_controller_ids: List[str]):
+        """
+        Extend the parsed executors and their derived frames with newly parsed executors and updated orders. When the
+        new executors close after every loaded one and replace none of them, the typed frame is extended as well;
+        otherwise it is recomputed on next use.
+        """
+        current = self._executors_df
+        replaced = current["id"].isin(executors["id"]) if not executors.empty else pd.Series(False, index=current.index)
+        if changed_controller_ids:
+            current = current.copy()
+            rows = current["controller_id"].isin(changed_controller_ids)
+            controllers = self.controllers_df.set_index("id")
+            current.loc[rows, "controller_type"] = current.loc[rows, "controller_id"].map(controllers["type"])
+            current.loc[rows, "controller_config"] = current.loc[rows, "controller_id"].map(controllers["config"])
+
+        self.executors_orders_index.update_orders(orders)
+        if not executors.empty:
+            self.executors_orders_index.add_executors(executors["id"], executors["order_ids"])
+        self.__dict__.pop("executors_with_orders", None)
+        if executors.empty:
+            self._executors_df = current
+            if changed_controller_ids:
+                for attribute in ["_typed_executors_df", "_executors_index", "_typed_executors_index"]:
+                    self.__dict__.pop(attribute, None)
+            return
+
+        is_in_order = (not replaced.any() and (current.empty or
+                                               executors["close_timestamp"].min() >= current["close_timestamp"].max()))
+        executors_df = pd.concat([current[~replaced.to_numpy()], executors], ignore_index=True)
+        if not is_in_order:
+            executors_df = executors_df.sort_values("close_timestamp", kind="stable", ignore_index=True)
+        self._executors_df = executors_df
+
+        extend_typed = is_in_order and "_typed_executors_df" in self.__dict__ and not changed_controller_ids
+        typed_executors_df = self.__dict__.get("_typed_executors_df")
+        for attribute in ["_typed_executors_df", "_executors_index", "_typed_executors_index"]:
+            self.__dict__.pop(attribute, None)
+        if extend_typed:
+            self._typed_executors_df = pd.concat([typed_executors_df,
+                                                  self.apply_executor_data_types(executors.copy())],
+                                                 ignore_index=True)
+
+    @staticmethod
+    def _max_timestamp(timestamps: pd.Series):
+        if timestamps is None:
+            return None
+        timestamps = pd.to_numeric(timestamps, errors="coerce").dropna()
+        if timestamps.empty:
+            return None
+        return timestamps_to_seconds(timestamps).max()
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Stable hash of the checkpoint id and the content of the executors, computed once per data source and again
+        after an append changes the data.
+        """
+        content = pd.util.hash_pandas_object(self._executors_df[self.FINGERPRINT_COLUMNS], index=False)
+        digest = hashlib.sha256(str(self.checkpoint_id).encode())
+        digest.update(content.to_numpy().tobytes())
+        return digest.hexdigest()[:32]
+
+    def cache_key(self, executors_filter: Dict[str, Any] = None, **kwargs) -> str:
+        """
+        Small token identifying the executors selected by a filter, to key cached computations on instead of hashing
+        the executors themselves. Extra keyword arguments are part of the key.
+        """
+        spec = {"filter": executors_filter or {}, **kwargs}
+        return f"{self.fingerprint}:{json.dumps(spec, sort_keys=True, default=self._cache_key_value)}"
+
+    @staticmethod
+    def _cache_key_value(value: Any) -> Any:
+        if isinstance(value, Enum):
+            return f"{type(value).__name__}.{value.name}"
+        return str(value)
+
     @property
     def controllers_dict(self):
         return {controller["id"]: controller["config"] for controller in self.controllers_df.to_dict(orient="records")}
 
     def get_executors_df(self, executors_filter: Dict[str, Any] = None, apply_executor_data_types: bool = False):
-        executors_df = pd.DataFrame(self.executors_dict)
-        executors_df["custom_info"] = executors_df["custom_info"].apply(
-            lambda x: json.loads(x) if isinstance(x, str) else x
-        )
-        executors_df["config"] = executors_df["config"].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-        executors_df["timestamp"] = executors_df["timestamp"].apply(lambda x: self.ensure_timestamp_in_seconds(x))
-        executors_df["close_timestamp"] = executors_df["close_timestamp"].apply(
-            lambda x: self.ensure_timestamp_in_seconds(x)
-        )
+        """
+        Get the executors of the checkpoint, optionally with enum data types and filtered. The parsed frames are
+        computed and indexed once per data source; each call only queries the index and returns a new frame the caller
+        is free to modify. The copy is shallow: the dicts and lists in the config, custom_info, controller_config and
+        order_ids cells are shared with the cached frames, so callers that change them must copy them first.
+        """
+        if executors_filter is not None:
+            index = self._typed_executors_index if apply_executor_data_types else self._executors_index
+            return index.filter(executors_filter)
+        executors_df = self._typed_executors_df if apply_executor_data_types else self._executors_df
+        return executors_df.copy()
+
+    @cached_property
+    def _executors_df(self) -> pd.DataFrame:
+        """Parsed executors joined with their controllers, computed on first use."""
+        return self._parse_executors(pd.DataFrame(self.executors_dict))
+
+    def _parse_executors(self, executors_df: pd.DataFrame) -> pd.DataFrame:
+        executors_df["custom_info"] = self.parse_json_column(executors_df["custom_info"])
+        executors_df["config"] = self.parse_json_column(executors_df["config"])
+        executors_df["timestamp"] = timestamps_to_seconds(executors_df["timestamp"], "executors timestamp")
+        executors_df["close_timestamp"] = timestamps_to_seconds(executors_df["close_timestamp"],
+                                                                "executors close_timestamp")
         executors_df.sort_values("close_timestamp", inplace=True)
-        executors_df["trading_pair"] = executors_df["config"].apply(lambda x: x["trading_pair"])
-        executors_df["exchange"] = executors_df["config"].apply(lambda x: x["connector_name"])
+        configs = executors_df["config"].tolist()
+        custom_infos = executors_df["custom_info"].tolist()
+        index = executors_df.index
+        executors_df["trading_pair"] = pd.Series([config["trading_pair"] for config in configs], index=index)
+        executors_df["exchange"] = pd.Series([config["connector_name"] for config in configs], index=index)
         executors_df["status"] = executors_df["status"].astype(int)
-        executors_df["level_id"] = executors_df["config"].apply(lambda x: x.get("level_id"))
-        executors_df["bep"] = executors_df["custom_info"].apply(lambda x: x["current_position_average_price"])
-        executors_df["order_ids"] = executors_df["custom_info"].apply(lambda x: x.get("order_ids"))
-        executors_df["close_price"] = executors_df["custom_info"].apply(
-            lambda x: x.get("close_price", x["current_position_average_price"]))
-        executors_df["sl"] = executors_df["config"].apply(lambda x: x.get("stop_loss")).fillna(0)
-        executors_df["tp"] = executors_df["config"].apply(lambda x: x.get("take_profit")).fillna(0)
-        executors_df["tl"] = executors_df["config"].apply(lambda x: x.get("time_limit")).fillna(0)
-        executors_df["close_type_name"] = executors_df["close_type"].apply(lambda x: self.get_enum_by_value(CloseType, x).name)
+        executors_df["level_id"] = pd.Series([config.get("level_id") for config in configs], index=index)
+        executors_df["bep"] = pd.Series([info["current_position_average_price"] for info in custom_infos], index=index)
+        executors_df["order_ids"] = pd.Series([info.get("order_ids") for info in custom_infos], index=index)
+        executors_df["close_price"] = pd.Series([info.get("close_price", info["current_position_average_price"])
+                                                 for info in custom_infos], index=index)
+        executors_df["sl"] = pd.Series([config.get("stop_loss") for config in configs], index=index).fillna(0)
+        executors_df["tp"] = pd.Series([config.get("take_profit") for config in configs], index=index).fillna(0)
+        executors_df["tl"] = pd.Series([config.get("time_limit") for config in configs], index=index).fillna(0)
+        executors_df["close_type_name"] = self.map_enum_values(executors_df["close_type"], CloseType).map(
+            lambda member: member.name)
 
         controllers = self.controllers_df.copy()
         controllers.drop(columns=["controller_id"], inplace=True)
@@ -76,54 +258,66 @@ class PerformanceDataSource:
             "id": "controller_id"
         }, inplace=True)
 
-        executors_df = executors_df.merge(controllers[["controller_id", "controller_type", "controller_config"]],
-                                          on="controller_id", how="left")
-        if apply_executor_data_types:
-            executors_df = self.apply_executor_data_types(executors_df)
-        if executors_filter is not None:
-            executors_df = self.filter_executors(executors_df, executors_filter)
-        return executors_df
+        return executors_df.merge(controllers[["controller_id", "controller_type", "controller_config"]],
+                                  on="controller_id", how="left")
+
+    @cached_property
+    def _typed_executors_df(self) -> pd.DataFrame:
+        """Parsed executors with enum data types, computed on first use."""
+        return self.apply_executor_data_types(self._executors_df.copy())
+
+    @cached_property
+    def executors_orders_index(self) -> ExecutorsOrdersIndex:
+        return ExecutorsOrdersIndex(self._executors_df["id"], self._executors_df["order_ids"], self.orders)
+
+    @cached_property
+    def executors_with_orders(self) -> pd.DataFrame:
+        """Completed orders of the executors, one row per executor and order."""
+        return self.executors_orders_index.executors_with_orders()
+
+    @cached_property
+    def _executors_index(self) -> ExecutorsFilterIndex:
+        return ExecutorsFilterIndex(self._executors_df)
+
+    @cached_property
+    def _typed_executors_index(self) -> ExecutorsFilterIndex:
+        return ExecutorsFilterIndex(self._typed_executors_df)
 
     def apply_executor_data_types(self, executors):
-        executors["status"] = executors["status"].apply(lambda x: self.get_enum_by_value(RunnableStatus, int(x)))
-        executors["side"] = executors["config"].apply(lambda x: self.get_enum_by_value(TradeType, int(x["side"])))
-        executors["close_type"] = executors["close_type"].apply(lambda x: self.get_enum_by_value(CloseType, int(x)))
+        """
+        Give the status, side and close type of the executors their enum types. The columns are categoricals whose
+        categories are the enum members, so filters and groupings work on small integer codes and each member is only
+        stored once.
+        """
+        executors["status"] = to_enum_categorical(executors["status"], RunnableStatus, "status")
+        executors["side"] = to_enum_categorical(pd.Series([config.get("side") for config in executors["config"]],
+                                                          index=executors.index, dtype=object), TradeType, "side")
+        executors["close_type"] = to_enum_categorical(executors["close_type"], CloseType, "close_type")
         executors["datetime"] = pd.to_datetime(executors.timestamp, unit="s")
         executors["close_datetime"] = pd.to_datetime(executors["close_timestamp"], unit="s")
         return executors
 
     @staticmethod
     def remove_executor_data_types(executors):
-        executors["status"] = executors["status"].apply(lambda x: x.value)
-        executors["side"] = executors["side"].apply(lambda x: x.value)
-        executors["close_type"] = executors["close_type"].apply(lambda x: x.value)
+        for column in ["status", "side", "close_type"]:
+            executors[column] = from_enum_categorical(executors[column])
         executors.drop(columns=["datetime", "close_datetime"], inplace=True)
         return executors
 
     @staticmethod
     def get_executors_with_orders(executors_df: pd.DataFrame, orders: pd.DataFrame):
-        df = (executors_df[["id", "order_ids"]]
-              .rename(columns={"id": "executor_id", "order_ids": "order_id"})
-              .explode("order_id"))
-        exec_with_orders = df.merge(orders, left_on="order_id", right_on="client_order_id", how="inner")
-        exec_with_orders = exec_with_orders[exec_with_orders["last_status"].isin(["SellOrderCompleted",
-                                                                                  "BuyOrderCompleted"])]
-        return exec_with_orders[["executor_id", "order_id", "last_status", "last_update_timestamp",
-                                 "price", "amount", "position"]]
+        return ExecutorsOrdersIndex(executors_df["id"], executors_df["order_ids"], orders).executors_with_orders()
 
     def get_executor_info_list(self,
-                               executors_filter: Dict[str, Any] = None) -> List[ExecutorInfo]:
+                               executors_filter: Dict[str, Any] = None) -> List[ExecutorRecord]:
         required_columns = [
-            "id", "timestamp", "type", "close_timestamp", "close_type", "status", "controller_type",
+            "id", "timestamp", "type", "close_timestamp", "close_type", "status",
             "net_pnl_pct", "net_pnl_quote", "cum_fees_quote", "filled_amount_quote",
-            "is_active", "is_trading", "controller_id", "side", "config", "custom_info", "exchange", "trading_pair"
+            "is_active", "is_trading", "controller_id", "config", "custom_info"
         ]
-        executors_df = self.get_executors_df(executors_filter=executors_filter,
-                                             apply_executor_data_types=True
-                                             )[required_columns].copy()
+        executors_df = self.get_executors_df(executors_filter=executors_filter)[required_columns]
         executors_df = executors_df[executors_df["net_pnl_quote"] != 0]
-        executor_info_list = executors_df.apply(lambda row: ExecutorInfo(**row.to_dict()), axis=1).tolist()
-        return executor_info_list
+        return build_executor_records(executors_df)
 
     def get_executor_dict(self,
                           executors_filter: Dict[str, Any] = None,
@@ -168,6 +362,36 @@ class PerformanceDataSource:
                 return member
         raise ValueError(f"No enum member with value {value}")
 
+    @staticmethod
+    def map_enum_values(values: pd.Series, enum_class) -> pd.Series:
+        """
+        Map a column of enum values to enum members with a single lookup table instead of scanning the enum per row.
+
+        Raises:
+        - ValueError: If a value doesn't belong to the enum.
+        """
+        members = values.map({member.value: member for member in enum_class})
+        unknown = members.isna()
+        if unknown.any():
+            raise ValueError(f"No enum member with value {values[unknown].iloc[0]}")
+        return members
+
+    @staticmethod
+    def parse_json_column(values: pd.Series) -> pd.Series:
+        """
+        Decode the JSON strings of a column, leaving already decoded values untouched. All the strings are decoded with
+        a single json.loads call over a JSON array built from them.
+        """
+        is_str = values.map(type) == str
+        if not is_str.any():
+            return values
+        parsed = json.loads("[" + ",".join(values[is_str]) + "]")
+        if is_str.all():
+            return pd.Series(parsed, index=values.index, dtype=object)
+        values = values.astype(object).copy()
+        values[is_str] = pd.Series(parsed, index=values.index[is_str], dtype=object)
+        return values
+
     @staticmethod
     def ensure_timestamp_in_seconds(timestamp: float) -> float:
         """
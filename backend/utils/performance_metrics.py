@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Union
+
+import numpy as np
+import pandas as pd
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.models.executors import CloseType
+
+EMPTY_RESULTS = {
+    "net_pnl": 0,
+    "net_pnl_quote": 0,
+    "total_executors": 0,
+    "total_executors_with_position": 0,
+    "total_volume": 0,
+    "total_long": 0,
+    "total_short": 0,
+    "close_types": {},
+    "accuracy_long": 0,
+    "accuracy_short": 0,
+    "total_positions": 0,
+    "accuracy": 0,
+    "max_drawdown_usd": 0,
+    "max_drawdown_pct": 0,
+    "sharpe_ratio": 0,
+    "profit_factor": 0,
+    "win_signals": 0,
+    "loss_signals": 0,
+}
+
+
+def summarize_results(executors_df: pd.DataFrame, total_amount_quote: float = 1000) -> Dict[str, Any]:
+    """
+    Compute the `results` of the get-performance-results endpoint from an executors frame, with the same definitions
+    as the backtesting engine of the backend. The executors are taken in the order of the frame, which for the data
+    source frames is the close time order.
+    :param executors_df: Executors as returned by PerformanceDataSource.get_executors_df, typed or not.
+    :param total_amount_quote: Capital the PnL and drawdown percentages are relative to.
+    :return:
+    """
+    if executors_df.empty:
+        return dict(EMPTY_RESULTS)
+    return next(iter(summarize_results_by(executors_df, [], total_amount_quote).values()))
+
+
+def summarize_results_by(executors_df: pd.DataFrame, by: Union[str, List[str]],
+                         total_amount_quote: float = 1000) -> Dict[Any, Dict[str, Any]]:
+    """
+    Compute the results of `summarize_results` for every group of executors in a single pass over the frame.
+    :param executors_df: Executors as returned by PerformanceDataSource.get_executors_df, typed or not.
+    :param by: Column or columns to group by, for example "side", "controller_id" or ["exchange", "trading_pair"].
+    The side is available as TradeType members even on untyped frames. An empty list computes a single group.
+    :param total_amount_quote: Capital the PnL and drawdown percentages are relative to.
+    :return: The results of each group, keyed like DataFrame.groupby keys. Groups without executors are missing.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    df = pd.DataFrame({
+        "net_pnl_quote": executors_df["net_pnl_quote"].astype(float).to_numpy(),
+        "filled_amount_quote": executors_df["filled_amount_quote"].astype(float).to_numpy(),
+        "side": _sides(executors_df),
+        "close_type_name": _close_type_names(executors_df),
+    })
+    for key in keys:
+        if key not in df.columns:
+            df[key] = executors_df[key].to_numpy()
+    group_keys = keys or ["_all"]
+    if not keys:
+        df["_all"] = 0
+    df["has_position"] = df["net_pnl_quote"] != 0
+    df["is_win"] = df["net_pnl_quote"] > 0
+    df["is_loss"] = df["net_pnl_quote"] < 0
+    df["is_long"] = df["has_position"] & (df["side"] == TradeType.BUY)
+    df["is_short"] = df["has_position"] & (df["side"] == TradeType.SELL)
+    df["position_volume"] = df["filled_amount_quote"].where(df["has_position"], 0)
+    df["is_correct_long"] = df["is_long"] & df["is_win"]
+    df["is_correct_short"] = df["is_short"] & df["is_win"]
+    df["won"] = df["net_pnl_quote"].where(df["is_win"], 0)
+    df["lost"] = -df["net_pnl_quote"].where(df["is_loss"], 0)
+
+    totals = df.groupby(group_keys, sort=False, dropna=False).agg(
+        net_pnl_quote=("net_pnl_quote", "sum"),
+        total_executors=("net_pnl_quote", "size"),
+        total_positions=("has_position", "sum"),
+        total_volume=("position_volume", "sum"),
+        total_long=("is_long", "sum"),
+        total_short=("is_short", "sum"),
+        correct_long=("is_correct_long", "sum"),
+        correct_short=("is_correct_short", "sum"),
+        win_signals=("is_win", "sum"),
+        loss_signals=("is_loss", "sum"),
+        total_won=("won", "sum"),
+        total_lost=("lost", "sum"),
+    )
+
+    # Drawdown and Sharpe ratio are computed on the cumulative PnL of the executors with position.
+    positions = df[df["has_position"]].copy()
+    positions["cumulative_returns"] = positions.groupby(group_keys, sort=False, dropna=False)["net_pnl_quote"].cumsum()
+    positions["cumulative_volume"] = positions.groupby(group_keys, sort=False,
+                                                       dropna=False)["filled_amount_quote"].cumsum()
+    positions["drawdown"] = positions["cumulative_returns"] - positions.groupby(
+        group_keys, sort=False, dropna=False)["cumulative_returns"].cummax()
+    positions["returns"] = positions["cumulative_returns"] / positions["cumulative_volume"]
+    totals = totals.join(positions.groupby(group_keys, sort=False, dropna=False).agg(
+        max_drawdown_usd=("drawdown", "min"),
+        first_cumulative_return=("cumulative_returns", "first"),
+        returns_mean=("returns", "mean"),
+        returns_std=("returns", "std"),
+    ))
+
+    # Aligned on the index of the totals rather than looked up by key, as null group keys are NaN, which never
+    # matches itself in a dict.
+    close_types = df[df["close_type_name"].notna()].groupby(
+        group_keys + ["close_type_name"], sort=False, dropna=False).size().unstack("close_type_name", fill_value=0)
+    close_types = close_types.reindex(index=totals.index, columns=sorted(close_types.columns), fill_value=0)
+    results = {}
+    for (key, row), (_, group_close_types) in zip(totals.iterrows(), close_types.iterrows()):
+        has_positions = row["total_positions"] > 0
+        results[key] = {
+            "net_pnl": float(row["net_pnl_quote"] / total_amount_quote),
+            "net_pnl_quote": float(row["net_pnl_quote"]),
+            "total_executors": int(row["total_executors"]),
+            "total_executors_with_position": int(row["total_positions"]),
+            "total_volume": float(row["total_volume"] * 2),
+            "total_long": int(row["total_long"]),
+            "total_short": int(row["total_short"]),
+            "close_types": {name: int(count) for name, count in group_close_types.items() if count > 0},
+            "accuracy_long": float(row["correct_long"] / row["total_long"]) if row["total_long"] > 0 else 0,
+            "accuracy_short": float(row["correct_short"] / row["total_short"]) if row["total_short"] > 0 else 0,
+            "total_positions": int(row["total_positions"]),
+            "accuracy": float(row["win_signals"] / row["total_positions"]) if has_positions else 0,
+            "max_drawdown_usd": float(row["max_drawdown_usd"]) if has_positions else 0,
+            "max_drawdown_pct": float(row["max_drawdown_usd"] / (total_amount_quote + row["first_cumulative_return"]))
+            if has_positions else 0,
+            "sharpe_ratio": float(row["returns_mean"] / row["returns_std"]) if row["total_positions"] > 1 else 0,
+            "profit_factor": float(row["total_won"] / row["total_lost"]) if row["total_lost"] > 0 else 1,
+            "win_signals": int(row["win_signals"]),
+            "loss_signals": int(row["loss_signals"]),
+        }
+    return results
+
+
+def _sides(executors_df: pd.DataFrame) -> np.ndarray:
+    members = {member.value: member for member in TradeType}
+    members.update({member: member for member in TradeType})
+    if "side" in executors_df.columns:
+        return executors_df["side"].map(members).to_numpy()
+    return pd.Series([members.get(config.get("side")) for config in executors_df["config"]], dtype=object).to_numpy()
+
+
+def _close_type_names(executors_df: pd.DataFrame) -> np.ndarray:
+    if "close_type_name" in executors_df.columns:
+        return executors_df["close_type_name"].to_numpy()
+    names = {member.value: member.name for member in CloseType}
+    names.update({member: member.name for member in CloseType})
+    return executors_df["close_type"].map(names).to_numpy()
@@ -0,0 +1,57 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Lower bound of each unit, from the finest to the coarsest, and the divisor that converts it to seconds.
+TIMESTAMP_UNITS = [
+    ("nanoseconds", 1e18, 1e9),
+    ("microseconds", 1e15, 1e6),
+    ("milliseconds", 1e12, 1e3),
+    ("seconds", 1e9, 1),
+]
+MAX_REPORTED_VALUES = 5
+
+
+def timestamps_to_seconds(timestamps: pd.Series, column: Optional[str] = None) -> pd.Series:
+    """
+    Convert a column of timestamps in seconds, milliseconds, microseconds or nanoseconds to seconds. The unit is
+    detected from the magnitude of each value, and when the whole column shares a unit it is converted with a single
+    division. Values are truncated to whole units first, like `PerformanceDataSource.ensure_timestamp_in_seconds`.
+    Null values are kept as NaN.
+    :param timestamps: Numbers or numeric strings.
+    :param column: Name used in the error message, the name of the series by default.
+    :return: Integer seconds when every value is in seconds and not null, float seconds otherwise.
+
+    Raises:
+    - ValueError: If some values are not timestamps in a recognized unit, listing how many and the first of them.
+    """
+    values = pd.to_numeric(timestamps, errors="coerce").to_numpy(dtype=float)
+    is_null = timestamps.isna().to_numpy()
+    values = np.trunc(values)
+    is_unrecognized = ~is_null & ~(np.isfinite(values) & (values >= TIMESTAMP_UNITS[-1][1]))
+    if is_unrecognized.any():
+        examples = timestamps[is_unrecognized].head(MAX_REPORTED_VALUES).tolist()
+        raise ValueError(
+            f"{is_unrecognized.sum()} of {len(values)} values of {column or timestamps.name or 'timestamps'} are not "
+            f"in a recognized format, for example {examples}. Must be in seconds, milliseconds, microseconds or "
+            f"nanoseconds.")
+
+    finite_values = values[~is_null]
+    if len(finite_values) > 0 and _divisor(finite_values.min()) == _divisor(finite_values.max()):
+        # Every value shares the unit, so the column is converted with a single division.
+        divisor = _divisor(finite_values.min())
+    else:
+        divisor = np.select([values >= lower_bound for _, lower_bound, _ in TIMESTAMP_UNITS[:-1]],
+                            [unit_divisor for _, _, unit_divisor in TIMESTAMP_UNITS[:-1]], default=1)
+    if np.all(divisor == 1) and not is_null.any():
+        return pd.Series(values.astype(np.int64), index=timestamps.index, name=timestamps.name)
+    return pd.Series(values / divisor, index=timestamps.index, name=timestamps.name)
+
+
+def _divisor(value: float) -> float:
+    """Divisor to seconds of a timestamp, from its magnitude."""
+    for _, lower_bound, divisor in TIMESTAMP_UNITS:
+        if value >= lower_bound:
+            return divisor
+    raise ValueError(f"Timestamp {value} is not in a recognized format.")
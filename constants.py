@@ -5,3 +5,4 @@ CONTROLLERS_PATH = "quants_lab/controllers"
 CONTROLLERS_CONFIG_PATH = "hummingbot_files/controller_configs"
 OPTIMIZATIONS_PATH = "quants_lab/optimizations"
 HUMMINGBOT_TEMPLATES = "hummingbot_files/templates"
+CHECKPOINTS_CACHE_PATH = "data/checkpoints_cache"
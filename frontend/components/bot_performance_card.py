@@ -65,11 +65,13 @@ class BotPerformanceCardV2(Dashboard.Item):
         for controller in self._stopped_controller_config_selected:
             self._backend_api_client.start_controller_from_bot(bot_name, controller)
 
-    def __call__(self, bot_name: str):
+    def __call__(self, bot_name: str, bot_status: dict = None, controller_configs: list = None):
         try:
-            controller_configs = backend_api_client.get_all_configs_from_bot(bot_name)
+            if controller_configs is None:
+                controller_configs = backend_api_client.get_all_configs_from_bot(bot_name)
             controller_configs = controller_configs if controller_configs else []
-            bot_status = backend_api_client.get_bot_status(bot_name)
+            if bot_status is None:
+                bot_status = backend_api_client.get_bot_status(bot_name)
             # Controllers Table
             active_controllers_list = []
             stopped_controllers_list = []
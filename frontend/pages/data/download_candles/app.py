@@ -1,10 +1,17 @@
+import os
 from datetime import datetime, time
 
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from backend.services.candles_downloader import CandlesDownloader
+from constants import CANDLES_DATA_PATH
 from frontend.st_utils import get_backend_api_client, initialize_st_page
+from frontend.visualization.downsampling import downsample_ohlc_chunks
+
+# Candles read at once to draw the chart, which shows the whole range aggregated into a bounded number of candles.
+CHART_CHUNK_SIZE = 100_000
 
 # Initialize Streamlit page
 initialize_st_page(title="Download Candles", icon="💾")
@@ -31,16 +38,24 @@ if get_data_button:
         st.error("End Date should be greater than Start Date.")
         st.stop()
 
-    candles = backend_api_client.get_historical_candles(
-        connector=connector,
-        trading_pair=trading_pair,
-        interval=interval,
-        start_time=int(start_datetime.timestamp()),
-        end_time=int(end_datetime.timestamp())
-    )
+    downloader = CandlesDownloader(backend_api_client, connector=connector, trading_pair=trading_pair,
+                                   interval=interval, start_time=int(start_datetime.timestamp()),
+                                   end_time=int(end_datetime.timestamp()), output_dir=CANDLES_DATA_PATH)
+    progress_bar = st.progress(0.0, text="Downloading candles...")
+    try:
+        downloader.download(on_progress=lambda completed, total: progress_bar.progress(
+            completed / total, text=f"Downloaded {completed}/{total} chunks"))
+    except Exception as e:
+        st.error(f"Download interrupted: {e}. Press the button again to resume from the last completed chunk.")
+        st.stop()
+    candles_path = downloader.merge(os.path.join(CANDLES_DATA_PATH, f"{downloader.name}.csv"))
 
-    candles_df = pd.DataFrame(candles)
-    candles_df.index = pd.to_datetime(candles_df["timestamp"], unit='s')
+    with open(candles_path) as candles_file:
+        total_candles = sum(1 for _ in candles_file) - 1
+    chunks = pd.read_csv(candles_path, usecols=["timestamp", "open", "high", "low", "close"],
+                         chunksize=CHART_CHUNK_SIZE)
+    candles_df = downsample_ohlc_chunks(
+        (chunk.set_index(pd.to_datetime(chunk["timestamp"], unit='s')) for chunk in chunks), total_candles)
 
     # Plotting the candlestick chart
     fig = go.Figure(data=[go.Candlestick(
@@ -64,12 +79,12 @@ if get_data_button:
     fig.update_yaxes(title_text="Price")
     st.plotly_chart(fig, use_container_width=True)
 
-    # Generating CSV and download button
-    csv = candles_df.to_csv(index=False)
+    # Download button serving the CSV written to disk
     filename = f"{connector}_{trading_pair}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv"
-    st.download_button(
-        label="Download Candles as CSV",
-        data=csv,
-        file_name=filename,
-        mime='text/csv',
-    )
+    with open(candles_path, "rb") as candles_file:
+        st.download_button(
+            label="Download Candles as CSV",
+            data=candles_file,
+            file_name=filename,
+            mime='text/csv',
+        )
@@ -1,9 +1,12 @@
+import asyncio
 import time
 from types import SimpleNamespace
 
 import streamlit as st
 from streamlit_elements import elements, mui
 
+from backend.services.async_backend_api_client import AsyncBackendAPIClient
+from CONFIG import BACKEND_API_MAX_CONCURRENCY
 from frontend.components.bot_performance_card import BotPerformanceCardV2
 from frontend.components.dashboard import Dashboard
 from frontend.st_utils import get_backend_api_client, initialize_st_page
@@ -20,6 +23,14 @@ def get_grid_positions(n_cards: int, cols: int = NUM_CARD_COLS, card_width: int
     return sorted(x_y, key=lambda x: (x[1], x[0]))
 
 
+def fetch_bots_data(api_client, bot_names):
+    async def fetch():
+        async with AsyncBackendAPIClient.from_client(api_client, max_concurrency=BACKEND_API_MAX_CONCURRENCY) as client:
+            return await asyncio.gather(client.get_bot_status_many(bot_names),
+                                        client.get_all_configs_from_bots(bot_names))
+    return asyncio.run(fetch())
+
+
 def update_active_bots(api_client):
     active_bots_response = api_client.get_active_bots_status()
     if active_bots_response.get("status") == "success":
@@ -41,10 +52,6 @@ def update_active_bots(api_client):
 initialize_st_page(title="Instances", icon="🦅")
 api_client = get_backend_api_client()
 
-if not api_client.is_docker_running():
-    st.warning("Docker is not running. Please start Docker and refresh the page.")
-    st.stop()
-
 if "active_instances_board" not in st.session_state:
     active_bots_response = api_client.get_active_bots_status()
     bot_cards = []
@@ -58,18 +65,20 @@ if "active_instances_board" not in st.session_state:
     if number_of_bots > 0:
         positions = get_grid_positions(number_of_bots, NUM_CARD_COLS, CARD_WIDTH, CARD_HEIGHT)
         for (bot, bot_info), (x, y) in zip(active_bots.items(), positions):
-            bot_status = api_client.get_bot_status(bot)
             card = BotPerformanceCardV2(board, x, y, CARD_WIDTH, CARD_HEIGHT)
             st.session_state.active_instances_board.bot_cards.append((card, bot))
 else:
     update_active_bots(api_client)
 
+bot_names = [bot for _, bot in st.session_state.active_instances_board.bot_cards]
+bots_status, bots_configs = fetch_bots_data(api_client, bot_names)
+
 with elements("active_instances_board"):
     with mui.Paper(sx={"padding": "2rem"}, variant="outlined"):
         mui.Typography("🏠 Local Instances", variant="h5")
         for card, bot in st.session_state.active_instances_board.bot_cards:
             with st.session_state.active_instances_board.dashboard():
-                card(bot)
+                card(bot, bot_status=bots_status[bot], controller_configs=bots_configs[bot])
 
 while True:
     time.sleep(10)
@@ -2,7 +2,6 @@ import asyncio
 
 import streamlit as st
 
-from backend.utils.performance_data_source import PerformanceDataSource
 from frontend.st_utils import get_backend_api_client, initialize_st_page
 from frontend.visualization.bot_performance import (
     display_execution_analysis,
@@ -19,8 +18,7 @@ async def main():
     backend_api = get_backend_api_client()
 
     st.subheader("🔫 DATA SOURCE")
-    checkpoint_data = display_etl_section(backend_api)
-    data_source = PerformanceDataSource(checkpoint_data)
+    data_source = display_etl_section(backend_api)
     st.divider()
 
     st.subheader("📊 OVERVIEW")
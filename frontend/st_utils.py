@@ -1,5 +1,6 @@
 import inspect
 import os.path
+import time
 from pathlib import Path
 
 import pandas as pd
@@ -12,6 +13,9 @@ from yaml import SafeLoader
 from CONFIG import AUTH_SYSTEM_ENABLED
 from frontend.pages.permissions import main_page, private_pages, public_pages
 
+# Seconds between reruns of a page waiting for the first Backend API status.
+DOCKER_STATUS_PENDING_RERUN_DELAY = 0.5
+
 
 def initialize_st_page(title: str, icon: str, layout="wide", initial_sidebar_state="expanded"):
     st.set_page_config(
@@ -73,16 +77,59 @@ def style_metric_cards(
 
 def get_backend_api_client():
     from backend.services.backend_api_client import BackendAPIClient
-    from CONFIG import BACKEND_API_HOST, BACKEND_API_PASSWORD, BACKEND_API_PORT, BACKEND_API_USERNAME
+    from CONFIG import (
+        BACKEND_API_CACHE_TTL,
+        BACKEND_API_CIRCUIT_FAILURE_THRESHOLD,
+        BACKEND_API_CIRCUIT_RESET_TIMEOUT,
+        BACKEND_API_CONNECT_TIMEOUT,
+        BACKEND_API_HOST,
+        BACKEND_API_MAX_RETRIES,
+        BACKEND_API_PASSWORD,
+        BACKEND_API_POOL_SIZE,
+        BACKEND_API_PORT,
+        BACKEND_API_READ_TIMEOUT,
+        BACKEND_API_USERNAME,
+    )
     try:
         backend_api_client = BackendAPIClient.get_instance(host=BACKEND_API_HOST, port=BACKEND_API_PORT,
-                                                           username=BACKEND_API_USERNAME, password=BACKEND_API_PASSWORD)
-        if not backend_api_client.is_docker_running():
-            st.error("Docker is not running. Please make sure Docker is running.")
-            st.stop()
-        return backend_api_client
+                                                           username=BACKEND_API_USERNAME, password=BACKEND_API_PASSWORD,
+                                                           pool_size=BACKEND_API_POOL_SIZE,
+                                                           connect_timeout=BACKEND_API_CONNECT_TIMEOUT,
+                                                           read_timeout=BACKEND_API_READ_TIMEOUT,
+                                                           cache_ttl=BACKEND_API_CACHE_TTL,
+                                                           max_retries=BACKEND_API_MAX_RETRIES,
+                                                           failure_threshold=BACKEND_API_CIRCUIT_FAILURE_THRESHOLD,
+                                                           reset_timeout=BACKEND_API_CIRCUIT_RESET_TIMEOUT)
     except Exception:
         st.stop()
+    docker_status_monitor = get_docker_status_monitor(backend_api_client)
+    if not docker_status_monitor.has_status:
+        # The first probe is still running, check again shortly instead of waiting for it.
+        st.info("Checking the Backend API status...")
+        time.sleep(DOCKER_STATUS_PENDING_RERUN_DELAY)
+        st.rerun()
+    if docker_status_monitor.is_stale:
+        if docker_status_monitor.last_error is None:
+            st.warning("Backend API status check is pending, please wait a few seconds and reload the page.")
+        else:
+            st.error(f"Backend API is not reachable: {docker_status_monitor.last_error}")
+        st.stop()
+    if not docker_status_monitor.is_docker_running:
+        st.error("Docker is not running. Please make sure Docker is running.")
+        st.stop()
+    return backend_api_client
+
+
+@st.cache_resource(show_spinner=False)
+def get_docker_status_monitor(_backend_api_client):
+    from backend.services.docker_status_monitor import DockerStatusMonitor
+    from CONFIG import DOCKER_STATUS_PROBE_TIMEOUT, DOCKER_STATUS_REFRESH_INTERVAL, DOCKER_STATUS_STALE_AFTER
+    docker_status_monitor = DockerStatusMonitor(_backend_api_client,
+                                                refresh_interval=DOCKER_STATUS_REFRESH_INTERVAL,
+                                                stale_after=DOCKER_STATUS_STALE_AFTER,
+                                                probe_timeout=DOCKER_STATUS_PROBE_TIMEOUT)
+    docker_status_monitor.start()
+    return docker_status_monitor
 
 
 def auth_system():
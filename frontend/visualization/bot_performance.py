@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 import plotly.graph_objects as go
@@ -7,6 +7,7 @@ from hummingbot.core.data_type.common import TradeType
 
 from backend.services.backend_api_client import BackendAPIClient
 from backend.utils.performance_data_source import PerformanceDataSource
+from backend.utils.performance_metrics import summarize_results, summarize_results_by
 from frontend.st_utils import download_csv_button, get_backend_api_client
 from frontend.visualization.backtesting import create_backtesting_figure
 from frontend.visualization.backtesting_metrics import render_accuracy_metrics, render_backtesting_metrics
@@ -22,12 +23,29 @@ intervals_to_secs = {
     "6h": 60 * 60 * 6,
     "1d": 60 * 60 * 24,
 }
+SPARKLINE_POINTS = 100
+
+
+def cumulative_sparklines(executors: pd.DataFrame, group_keys: List[str], value_column: str = "net_pnl_quote",
+                          max_points: int = SPARKLINE_POINTS) -> pd.Series:
+    """
+    Cumulative sum of a column for every group, computed with a single groupby over executors already in time order.
+    Each series is downsampled to at most `max_points` values by keeping the last value of evenly sized buckets, so
+    the last point is always the final total.
+    :return: List of values per group, indexed by the group keys.
+    """
+    groups = executors.groupby(group_keys, sort=False)
+    cumulative = groups[value_column].cumsum()
+    position = groups.cumcount().to_numpy()
+    size = groups[value_column].transform("size").to_numpy()
+    # A row is kept when it is the last of its bucket: the next row of its group falls in another bucket.
+    is_kept = position * max_points // size != (position + 1) * max_points // size
+    return cumulative[is_kept].groupby([executors.loc[is_kept, key] for key in group_keys]).agg(list)
 
 
 def display_performance_summary_table(executors, executors_with_orders: pd.DataFrame):
     if not executors_with_orders.empty:
         executors.sort_values("close_timestamp", inplace=True)
-        executors["net_pnl_over_time"] = executors["net_pnl_quote"].cumsum()
         executors = executors[~executors["close_type_name"].isin(["INSUFFICIENT_BALANCE", "EXPIRED"])]
         grouped_executors = executors.groupby(["controller_id", "controller_type", "exchange", "trading_pair"]).agg(
             net_pnl_quote=("net_pnl_quote", "sum"),
@@ -36,13 +54,9 @@ def display_performance_summary_table(executors, executors_with_orders: pd.DataF
             close_timestamp=("close_timestamp", "max"),
             filled_amount_quote=("filled_amount_quote", "sum")
         ).reset_index()
-        grouped_executors["net_pnl_over_time"] = grouped_executors.apply(
-            lambda row: executors[
-                (executors["controller_id"] == row["controller_id"]) &
-                (executors["exchange"] == row["exchange"]) &
-                (executors["trading_pair"] == row["trading_pair"])
-                ]["net_pnl_quote"].cumsum().tolist(), axis=1
-        )
+        sparklines = cumulative_sparklines(executors, ["controller_id", "controller_type", "exchange", "trading_pair"])
+        grouped_executors["net_pnl_over_time"] = sparklines.reindex(
+            pd.MultiIndex.from_frame(grouped_executors[sparklines.index.names])).tolist()
         grouped_executors["exchange"] = grouped_executors["exchange"].apply(lambda x: x.replace("_", " ").capitalize())
         grouped_executors["controller_type"] = grouped_executors["controller_type"].apply(
             lambda x: x.replace("_", " ").capitalize()
@@ -87,8 +101,8 @@ def display_global_results(data_source: PerformanceDataSource):
     selected_controllers_filter = {
         "controller_id": selected_controllers if len(selected_controllers) > 0 else list(data_source.controllers_dict.keys())
     }
-    executors_dict = data_source.get_executor_dict(selected_controllers_filter)
-    results_response = fetch_global_results(executors_dict)
+    results_response, side_results = fetch_global_results(data_source.cache_key(selected_controllers_filter),
+                                                          data_source, selected_controllers_filter)
 
     render_backtesting_metrics(summary_results=results_response,
                                title="Global Metrics")
@@ -96,10 +110,12 @@ def display_global_results(data_source: PerformanceDataSource):
     long_col, short_col = st.columns(2)
     with long_col:
         with st.container(border=True):
-            display_side_analysis(data_source, selected_controllers_filter, is_long=True)
+            display_side_analysis(data_source, side_results.get(TradeType.BUY), selected_controllers_filter,
+                                  is_long=True)
     with short_col:
         with st.container(border=True):
-            display_side_analysis(data_source, selected_controllers_filter, is_long=False)
+            display_side_analysis(data_source, side_results.get(TradeType.SELL), selected_controllers_filter,
+                                  is_long=False)
 
     executors_df = data_source.get_executors_df(executors_filter=selected_controllers_filter,
                                                 apply_executor_data_types=True)
@@ -107,21 +123,21 @@ def display_global_results(data_source: PerformanceDataSource):
 
 
 @st.cache_data(show_spinner=False)
-def fetch_global_results(executors_dict: List[Dict[str, Any]]):
-    backend_api = get_backend_api_client()
-    results_response = backend_api.get_performance_results(executors=executors_dict)
-    return results_response.get("results", {})
+def fetch_global_results(cache_key: str, _data_source: PerformanceDataSource, _executors_filter: Dict[str, Any]):
+    """
+    Results of all the executors and of each side, computed locally in one pass per grouping. Only the cache key of
+    the data source and filter is hashed by streamlit.
+    """
+    executors_df = _data_source.get_executors_df(_executors_filter)
+    return summarize_results(executors_df), summarize_results_by(executors_df, "side")
 
 
 def display_side_analysis(data_source: PerformanceDataSource,
+                          results: Optional[Dict[str, Any]],
                           current_filter: Dict[str, Any] = None,
                           is_long: bool = True):
     side_filter = current_filter.copy()
     side_filter["side"] = [TradeType.BUY] if is_long else [TradeType.SELL]
-    executors_dict = data_source.get_executor_dict(side_filter,
-                                                   apply_executor_data_types=True,
-                                                   remove_special_fields=True)
-    results = fetch_long_results(executors_dict) if is_long else fetch_short_results(executors_dict)
     if results:
         side_str = "Long" if is_long else "Short"
         st.write(f"### {side_str} Positions")
@@ -142,20 +158,6 @@ def display_side_analysis(data_source: PerformanceDataSource,
         display_executors_by_close_type_metrics(executors_df)
 
 
-@st.cache_data(show_spinner=False)
-def fetch_long_results(executors_dict: List[Dict[str, Any]]):
-    backend_api = get_backend_api_client()
-    results_response = backend_api.get_performance_results(executors=executors_dict)
-    return results_response.get("results", {})
-
-
-@st.cache_data(show_spinner=False)
-def fetch_short_results(executors_dict: List[Dict[str, Any]]):
-    backend_api = get_backend_api_client()
-    results_response = backend_api.get_performance_results(executors=executors_dict)
-    return results_response.get("results", {})
-
-
 def display_execution_analysis(data_source: PerformanceDataSource):
     st.write("### Filters")
     col1, col2 = st.columns([2, 1])
@@ -195,14 +197,22 @@ def display_execution_analysis(data_source: PerformanceDataSource):
             "end_time": end_time
         }
         candles_df = fetch_market_data(candles_params)
-
-        executors_dict: List[Dict[str, Any]] = data_source.get_executor_dict(executors_filter)
-        performance_results = fetch_performance_results(executors_dict)
+        # Charts are downsampled to their width, zooming into a range draws it at a higher resolution.
+        range_start = pd.to_datetime(start_time, unit="s").to_pydatetime()
+        range_end = pd.to_datetime(end_time, unit="s").to_pydatetime()
+        visible_range = st.slider("Visible range", min_value=range_start, max_value=range_end,
+                                  value=(range_start, range_end), step=pd.Timedelta(seconds=intervals_to_secs[interval]),
+                                  format="YYYY-MM-DD HH:mm")
+        x_range = None if visible_range == (range_start, range_end) else visible_range
+
+        performance_results = fetch_performance_results(data_source.cache_key(executors_filter), data_source,
+                                                        executors_filter)
         executors_info_list = data_source.get_executor_info_list(executors_filter)
 
         fig = create_backtesting_figure(df=candles_df,
                                         executors=executors_info_list,
-                                        config=config)
+                                        config=config,
+                                        x_range=x_range)
 
         performance_section(performance_results, fig, "Real Performance")
         with config_tab:
@@ -232,10 +242,8 @@ def fetch_market_data(params: Dict[str, Any] = None):
 
 
 @st.cache_data()
-def fetch_performance_results(executors_dict: List[Dict[str, Any]]):
-    backend_api = get_backend_api_client()
-    results_response = backend_api.get_performance_results(executors=executors_dict)
-    return results_response.get("results", {})
+def fetch_performance_results(cache_key: str, _data_source: PerformanceDataSource, _executors_filter: Dict[str, Any]):
+    return summarize_results(_data_source.get_executors_df(_executors_filter))
 
 
 def performance_section(results: dict, fig=None, title: str = "Backtesting Metrics"):
@@ -2,9 +2,11 @@ import pandas as pd
 import plotly.graph_objects as go
 
 from frontend.visualization import theme
+from frontend.visualization.downsampling import DEFAULT_MAX_POINTS, downsample_line, downsample_ohlc
 
 
-def get_candlestick_trace(df):
+def get_candlestick_trace(df, max_points: int = DEFAULT_MAX_POINTS, x_range=None):
+    df = downsample_ohlc(df, max_points, x_range)
     return go.Candlestick(x=df.index,
                           open=df['open'],
                           high=df['high'],
@@ -14,10 +16,11 @@ def get_candlestick_trace(df):
                           increasing_line_color='#2ECC71', decreasing_line_color='#E74C3C', )
 
 
-def get_bt_candlestick_trace(df):
+def get_bt_candlestick_trace(df, max_points: int = DEFAULT_MAX_POINTS, x_range=None):
     df.index = pd.to_datetime(df.timestamp, unit='s')
-    return go.Scatter(x=df.index,
-                      y=df['close'],
+    positions = downsample_line(df.index, df['close'], max_points, x_range)
+    return go.Scatter(x=df.index[positions],
+                      y=df['close'].iloc[positions],
                       mode='lines',
                       line=dict(color=theme.get_color_scheme()["price"]),
                       )
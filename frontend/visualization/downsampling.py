@@ -0,0 +1,129 @@
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Points kept per trace, about two per horizontal pixel of a full width chart.
+DEFAULT_MAX_POINTS = 2000
+
+
+def to_numeric_x(x) -> np.ndarray:
+    """X values as floats, with datetimes as nanoseconds since the epoch."""
+    x = pd.Index(x)
+    if isinstance(x, pd.DatetimeIndex):
+        return x.asi8.astype(float)
+    return x.to_numpy(dtype=float)
+
+
+def visible_slice(x, x_range: Optional[Tuple] = None) -> slice:
+    """
+    Positions of the sorted x values within the visible range, plus one point on each side so the lines reach the
+    edges of the chart.
+    :param x: Sorted x values, numbers or datetimes.
+    :param x_range: Start and end of the visible range, None or a None bound to show everything.
+    """
+    if x_range is None:
+        return slice(0, len(x))
+    start, end = x_range
+    values = to_numeric_x(x)
+    lower = np.searchsorted(values, to_numeric_x([start])[0], side="left") if start is not None else 0
+    upper = np.searchsorted(values, to_numeric_x([end])[0], side="right") if end is not None else len(values)
+    return slice(max(lower - 1, 0), min(upper + 1, len(values)))
+
+
+def lttb_indices(x, y, max_points: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+    """
+    Positions of the points kept by Largest-Triangle-Three-Buckets: the first and last points, and from each bucket
+    in between the point forming the largest triangle with the point kept from the previous bucket and the average of
+    the next one. Keeps the visual shape of a line, including its spikes, with a fixed number of points.
+    :param x: Sorted x values, numbers or datetimes.
+    :param y: Y values.
+    :param max_points: Number of points to keep, at least 3.
+    :return: Sorted positions of the kept points, all of them when there are no more than max_points.
+    """
+    x = to_numeric_x(x)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    size = len(x)
+    if size <= max_points or max_points < 3:
+        return np.arange(size)
+
+    # Buckets of the points between the first and the last one, and the average point of each of them.
+    edges = np.linspace(1, size - 1, max_points - 1).astype(np.int64)
+    counts = np.diff(edges)
+    average_x = np.append(np.add.reduceat(x[1:size - 1], edges[:-1] - 1) / counts, x[-1])
+    average_y = np.append(np.add.reduceat(y[1:size - 1], edges[:-1] - 1) / counts, y[-1])
+
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0], indices[-1] = 0, size - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        areas = np.abs((x[previous] - average_x[bucket + 1]) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (average_y[bucket + 1] - y[previous]))
+        previous = start + int(np.argmax(areas))
+        indices[bucket + 1] = previous
+    return indices
+
+
+def downsample_line(x, y, max_points: int = DEFAULT_MAX_POINTS, x_range: Optional[Tuple] = None) -> np.ndarray:
+    """
+    Positions of the points of a line to draw for the visible range. Zooming into a range re-samples it with the
+    whole point budget, so the chart gets more detailed as the range narrows.
+    """
+    visible = visible_slice(x, x_range)
+    x, y = np.asarray(x)[visible], np.asarray(y)[visible]
+    return lttb_indices(x, y, max_points) + visible.start
+
+
+def downsample_ohlc(df: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS,
+                    x_range: Optional[Tuple] = None) -> pd.DataFrame:
+    """
+    Aggregate candles into at most max_points candles of consecutive ones, with the open of the first, the highest
+    high, the lowest low and the close of the last, so every price reached stays visible.
+    :param df: Candles sorted by their datetime index, with open, high, low and close columns.
+    :param max_points: Number of candles to keep.
+    :param x_range: Visible range of the index, aggregated at a resolution that grows as the range narrows.
+    :return: The candles of the visible range, indexed by the datetime of the first candle of each bucket.
+    """
+    df = df.iloc[visible_slice(df.index, x_range)]
+    if len(df) <= max_points:
+        return df
+    return _aggregate_ohlc(df, np.unique(np.linspace(0, len(df), max_points, endpoint=False).astype(np.int64)))
+
+
+def downsample_ohlc_chunks(chunks: Iterable[pd.DataFrame], total_rows: int,
+                           max_points: int = DEFAULT_MAX_POINTS) -> pd.DataFrame:
+    """
+    Aggregate candles read in chunks, like `downsample_ohlc`, holding a single chunk in memory besides the result.
+    Buckets have the same number of consecutive candles, whichever chunk they start in.
+    :param chunks: Consecutive chunks of candles sorted by their datetime index, e.g. from pd.read_csv(chunksize=...).
+    :param total_rows: Number of candles of all the chunks together.
+    :param max_points: Number of candles to keep.
+    :return:
+    """
+    bucket_size = max(1, -(-total_rows // max_points))
+    buckets = []
+    remainder = None
+    for chunk in chunks:
+        if remainder is not None:
+            chunk = pd.concat([remainder, chunk])
+        complete = len(chunk) - len(chunk) % bucket_size
+        remainder = chunk.iloc[complete:]
+        if complete > 0:
+            buckets.append(_aggregate_ohlc(chunk.iloc[:complete], np.arange(0, complete, bucket_size)))
+    if remainder is not None and len(remainder) > 0:
+        buckets.append(_aggregate_ohlc(remainder, np.arange(0, len(remainder), bucket_size)))
+    if not buckets:
+        return pd.DataFrame(columns=["open", "high", "low", "close"])
+    return pd.concat(buckets)
+
+
+def _aggregate_ohlc(df: pd.DataFrame, starts: np.ndarray) -> pd.DataFrame:
+    """Aggregate the candles of each bucket, given the positions where the buckets start."""
+    ends = np.append(starts[1:], len(df)) - 1
+    return pd.DataFrame({
+        "open": df["open"].to_numpy()[starts],
+        "high": np.maximum.reduceat(df["high"].to_numpy(dtype=float), starts),
+        "low": np.minimum.reduceat(df["low"].to_numpy(dtype=float), starts),
+        "close": df["close"].to_numpy()[ends],
+    }, index=df.index[starts])
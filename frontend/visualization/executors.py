@@ -1,26 +1,55 @@
-from decimal import Decimal
-
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from hummingbot.connector.connector_base import TradeType
 
+EXECUTOR_HOVER_TEMPLATE = "%{customdata[0]} Executor<br>Net PnL: %{customdata[1]:.4f}<br>ID: %{customdata[2]}" \
+                          "<extra></extra>"
+
 
-def add_executors_trace(fig, executors, row, col):
-    for executor in executors:
-        entry_time = pd.to_datetime(executor.timestamp, unit='s')
-        entry_price = executor.custom_info["current_position_average_price"]
-        exit_time = pd.to_datetime(executor.close_timestamp, unit='s')
-        exit_price = executor.custom_info.get("close_price", executor.custom_info["current_position_average_price"])
-        name = "Buy Executor" if executor.config.side == TradeType.BUY else "Sell Executor"
+def add_executors_trace(fig, executors, row, col, use_scattergl: bool = False):
+    """
+    Draw every executor as a segment from its entry to its exit, in at most three traces: winning, losing and unfilled
+    executors. The segments of a trace are separated by gaps, and the side, net PnL and id of each executor are
+    shown on hover through customdata.
+    :param use_scattergl: Render the segments with WebGL, for figures with many executors.
+    """
+    if len(executors) == 0:
+        return fig
+    entry_time = np.array([executor.timestamp for executor in executors], dtype=float)
+    exit_time = np.array([executor.close_timestamp for executor in executors], dtype=float)
+    entry_price = np.array([executor.custom_info["current_position_average_price"] for executor in executors],
+                           dtype=float)
+    exit_price = np.array([executor.custom_info.get("close_price", executor.custom_info["current_position_average_price"])
+                           for executor in executors], dtype=float)
+    filled_amount_quote = np.array([executor.filled_amount_quote for executor in executors], dtype=float)
+    net_pnl_quote = np.array([executor.net_pnl_quote for executor in executors], dtype=float)
+    side = np.array(["Buy" if executor.config.side == TradeType.BUY else "Sell" for executor in executors],
+                    dtype=object)
+    executor_id = np.array([executor.id for executor in executors], dtype=object)
 
-        if executor.filled_amount_quote == 0:
-            fig.add_trace(go.Scatter(x=[entry_time, exit_time], y=[entry_price, entry_price], mode='lines',
-                                     line=dict(color='grey', width=2, dash="dash"), name=name), row=row, col=col)
-        else:
-            if executor.net_pnl_quote > Decimal(0):
-                fig.add_trace(go.Scatter(x=[entry_time, exit_time], y=[entry_price, exit_price], mode='lines',
-                                         line=dict(color='green', width=3), name=name), row=row, col=col)
-            else:
-                fig.add_trace(go.Scatter(x=[entry_time, exit_time], y=[entry_price, exit_price], mode='lines',
-                                         line=dict(color='red', width=3), name=name), row=row, col=col)
+    is_unfilled = filled_amount_quote == 0
+    is_winning = ~is_unfilled & (net_pnl_quote > 0)
+    is_losing = ~is_unfilled & ~is_winning
+    exit_price = np.where(is_unfilled, entry_price, exit_price)
+    entry_datetime = (entry_time * 1e3).astype("datetime64[ms]")
+    exit_datetime = (exit_time * 1e3).astype("datetime64[ms]")
+    scatter = go.Scattergl if use_scattergl else go.Scatter
+    for name, mask, line in [("Winning Executors", is_winning, dict(color='green', width=3)),
+                             ("Losing Executors", is_losing, dict(color='red', width=3)),
+                             ("Unfilled Executors", is_unfilled, dict(color='grey', width=2, dash="dash"))]:
+        if not mask.any():
+            continue
+        # The gap after each segment is a point at its exit time without price.
+        x = _segments(entry_datetime[mask], exit_datetime[mask], exit_datetime[mask])
+        y = _segments(entry_price[mask], exit_price[mask], np.full(mask.sum(), np.nan))
+        fig.add_trace(scatter(x=x, y=y, hovertemplate=EXECUTOR_HOVER_TEMPLATE, mode='lines', line=line, name=name),
+                      row=row, col=col)
+        # Set after adding the trace, which deep copies object arrays element by element.
+        customdata = np.column_stack([side[mask], net_pnl_quote[mask], executor_id[mask]])
+        fig.data[-1].customdata = _segments(customdata, customdata, np.full_like(customdata, None))
     return fig
+
+
+def _segments(starts: np.ndarray, ends: np.ndarray, gaps: np.ndarray) -> np.ndarray:
+    """Interleave the start and end of each segment followed by a gap: start_0, end_0, gap_0, start_1, end_1, gap_1..."""
+    return np.stack([starts, ends, gaps], axis=1).reshape((-1,) + starts.shape[1:])
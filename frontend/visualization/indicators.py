@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pandas_ta as ta  # noqa: F401
 import plotly.graph_objects as go
@@ -40,8 +41,8 @@ def get_macd_traces(df, macd_fast, macd_slow, macd_signal):
         go.Scatter(x=df.index, y=df[macd_s], line=dict(color=tech_colors['macd_signal']),
                    name='MACD Signal'),
         go.Bar(x=df.index, y=df[macd_hist], name='MACD Histogram',
-               marker_color=df[f"MACDh_{macd_fast}_{macd_slow}_{macd_signal}"].apply(
-                   lambda x: '#FF6347' if x < 0 else '#32CD32'))
+               marker_color=theme.get_sign_colors(df[macd_hist], tech_colors['macd_histogram_positive'],
+                                                  tech_colors['macd_histogram_negative'], zero_is_positive=True))
     ]
     return traces
 
@@ -53,32 +54,31 @@ def get_supertrend_traces(df, length, multiplier):
     supertrend = f'SUPERT_{length}_{multiplier}'
     df = df[df[supertrend] > 0]
 
-    # Create segments for line with different colors
-    segments = []
-    current_segment = {"x": [], "y": [], "color": None}
-
-    for i in range(len(df)):
-        if i == 0 or df[supertrend_d].iloc[i] == df[supertrend_d].iloc[i - 1]:
-            current_segment["x"].append(df.index[i])
-            current_segment["y"].append(df[supertrend].iloc[i])
-            current_segment["color"] = tech_colors['buy'] if df[supertrend_d].iloc[i] == 1 else tech_colors['sell']
-        else:
-            segments.append(current_segment)
-            current_segment = {"x": [df.index[i - 1], df.index[i]],
-                               "y": [df[supertrend].iloc[i - 1], df[supertrend].iloc[i]],
-                               "color": tech_colors['buy'] if df[supertrend_d].iloc[i] == 1 else tech_colors['sell']}
-
-    segments.append(current_segment)
+    direction = df[supertrend_d].to_numpy()
+    values = df[supertrend].to_numpy(dtype=float)
+    # Runs of consecutive rows with the same direction. Every run after the first also starts at the last row of the
+    # previous run, so the line stays connected where its color changes.
+    run_starts = np.flatnonzero(np.diff(direction, prepend=np.nan) != 0)
+    run_ends = np.append(run_starts[1:], len(direction))
+    traces = []
+    for is_up, color in [(True, tech_colors['buy']), (False, tech_colors['sell'])]:
+        runs = (direction[run_starts] == 1) == is_up
+        positions, is_gap = _segment_positions(np.maximum(run_starts[runs] - 1, 0), run_ends[runs])
+        y = values[positions]
+        y[is_gap] = np.nan
+        traces.append(go.Scatter(x=df.index[positions], y=y, mode='lines', line=dict(color=color, width=2),
+                                 name='SuperTrend'))
+    return traces
 
-    # Create traces from segments
-    traces = [
-        go.Scatter(
-            x=segment["x"],
-            y=segment["y"],
-            mode='lines',
-            line=dict(color=segment["color"], width=2),
-            name='SuperTrend'
-        ) for segment in segments
-    ]
 
-    return traces
+def _segment_positions(starts, ends):
+    """
+    Row positions of consecutive segments followed by a gap each, and the mask of the gaps, which repeat the last row
+    of their segment.
+    """
+    lengths = ends - starts + 1
+    offsets = np.cumsum(lengths) - lengths
+    local_positions = np.arange(lengths.sum()) - np.repeat(offsets, lengths)
+    is_gap = local_positions == np.repeat(lengths - 1, lengths)
+    positions = np.repeat(starts, lengths) + np.minimum(local_positions, np.repeat(lengths - 2, lengths))
+    return positions, is_gap
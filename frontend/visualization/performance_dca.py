@@ -45,7 +45,7 @@ def display_dca_performance(executors: pd.DataFrame):
                                                 hole=0.4))
         st.plotly_chart(level_id_pie_chart_fig, use_container_width=True)
     with col2:
-        intra_level_id_data = executors.groupby(['exit_level', 'close_type']).size().reset_index(name='count')
+        intra_level_id_data = executors.groupby(['exit_level', 'close_type'], observed=True).size().reset_index(name='count')
         fig = go.Figure()
         fig.add_trace(go.Pie(labels=intra_level_id_data.loc[intra_level_id_data["exit_level"] != 0, 'exit_level'],
                              values=intra_level_id_data.loc[intra_level_id_data["exit_level"] != 0, 'count'],
@@ -1,8 +1,13 @@
-import json
+from typing import Any, Dict, List
 
+import pandas as pd
 import streamlit as st
 
 from backend.services.backend_api_client import BackendAPIClient
+from backend.services.checkpoint_cache import DEFAULT_CHECKPOINT_COLUMNS, CheckpointCache, decode_checkpoint_table
+from backend.utils.performance_data_source import PerformanceDataSource
+from CONFIG import CHECKPOINT_CACHE_TTL
+from constants import CHECKPOINTS_CACHE_PATH
 
 
 def display_etl_section(backend_api: BackendAPIClient):
@@ -32,6 +37,11 @@ def display_etl_section(backend_api: BackendAPIClient):
                 if st.button("Save"):
                     response = backend_api.create_checkpoint(selected_dbs)
                     if response["message"] == "Checkpoint created successfully.":
+                        # The checkpoint may replace one with the same name, so every cached copy is dropped.
+                        fetch_checkpoint_data.clear()
+                        CheckpointCache(backend_api, CHECKPOINTS_CACHE_PATH).invalidate()
+                        st.session_state.pop("performance_data_source", None)
+                        st.session_state.pop("performance_checkpoint", None)
                         st.success("Checkpoint created successfully!")
                     else:
                         st.error("Error creating checkpoint. Please try again.")
@@ -41,15 +51,40 @@ def display_etl_section(backend_api: BackendAPIClient):
         st.stop()
     else:
         selected_checkpoint = st.selectbox("Select a checkpoint to load", checkpoints_list)
-        checkpoint_data = fetch_checkpoint_data(backend_api, selected_checkpoint)
-        checkpoint_data["executors"] = json.loads(checkpoint_data["executors"])
-        checkpoint_data["orders"] = json.loads(checkpoint_data["orders"])
-        checkpoint_data["trade_fill"] = json.loads(checkpoint_data["trade_fill"])
-        checkpoint_data["controllers"] = json.loads(checkpoint_data["controllers"])
-        return checkpoint_data
+        data_source = st.session_state.get("performance_data_source")
+        if data_source is None or st.session_state.get("performance_checkpoint") != selected_checkpoint:
+            checkpoint_data = fetch_checkpoint_data(backend_api, selected_checkpoint)
+            if checkpoint_data is None:
+                # Don't keep the failed load around, so the next run requests the checkpoint again.
+                fetch_checkpoint_data.clear()
+                st.stop()
+            data_source = PerformanceDataSource(checkpoint_data, checkpoint_id=selected_checkpoint)
+            st.session_state["performance_data_source"] = data_source
+            st.session_state["performance_checkpoint"] = selected_checkpoint
+        display_live_refresh(data_source, [db for db in dbs_dict if db["healthy"]])
+        return data_source
 
 
-@st.cache_data
+def display_live_refresh(data_source: PerformanceDataSource, healthy_dbs: List[Dict[str, Any]]):
+    """Append to the loaded checkpoint the rows the selected databases got since it was created."""
+    with st.expander("Refresh from live DBs"):
+        st.markdown("Ingest only the executors, orders and trade fills that are newer than the loaded data.")
+        db_names = {db["db_path"].replace("sqlite:///", ""): db for db in healthy_dbs}
+        live_dbs = st.multiselect("Choose the databases of the running bots", list(db_names),
+                                  label_visibility="collapsed")
+        if st.button("Refresh", disabled=len(live_dbs) == 0):
+            delta = {}
+            for table in ["executors", "orders", "trade_fill", "controllers"]:
+                frames = [decode_checkpoint_table(db_names[db]["tables"][table], DEFAULT_CHECKPOINT_COLUMNS[table])
+                          for db in live_dbs if table in db_names[db].get("tables", {})]
+                if frames:
+                    delta[table] = pd.concat(frames, ignore_index=True)
+            ingested = data_source.append(delta)
+            st.success(f"Added {ingested['executors']} executors, {ingested['orders']} orders and "
+                       f"{ingested['trade_fill']} trade fills.")
+
+
+@st.cache_resource(ttl=CHECKPOINT_CACHE_TTL)
 def fetch_checkpoint_data(_backend_api: BackendAPIClient, selected_checkpoint: str):
-    checkpoint_data = _backend_api.load_checkpoint(selected_checkpoint)
-    return checkpoint_data
+    # The tables are shared by every session instead of being pickled per session; PerformanceDataSource copies them.
+    return CheckpointCache(_backend_api, CHECKPOINTS_CACHE_PATH, ttl=CHECKPOINT_CACHE_TTL).load(selected_checkpoint)
@@ -3,26 +3,29 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from frontend.visualization.theme import get_color_scheme
+from frontend.visualization.downsampling import DEFAULT_MAX_POINTS, downsample_line
+from frontend.visualization.theme import get_color_scheme, get_sign_colors
 
 
-def create_combined_subplots(executors: pd.DataFrame):
+def create_combined_subplots(executors: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS):
     fig = make_subplots(rows=4, cols=1, shared_xaxes=True, vertical_spacing=0.1,
                         subplot_titles=["Cumulative PnL",
                                         "Cumulative Volume",
                                         "Cumulative Positions",
                                         "Win/Loss Ratio"])
 
-    pnl_trace = get_pnl_traces(executors)
+    evolution = get_performance_evolution(executors)
+
+    pnl_trace = get_pnl_traces(evolution, max_points)
     fig.add_trace(pnl_trace, row=1, col=1)
 
-    volume_trace = get_volume_bar_traces(executors)
+    volume_trace = get_volume_bar_traces(evolution, max_points)
     fig.add_trace(volume_trace, row=2, col=1)
 
-    activity_trace = get_total_executions_with_position_bar_traces(executors)
+    activity_trace = get_total_executions_with_position_bar_traces(evolution, max_points)
     fig.add_trace(activity_trace, row=3, col=1)
 
-    win_loss_fig = get_win_loss_ratio_fig(executors)
+    win_loss_fig = get_win_loss_ratio_fig(evolution, max_points)
     for trace in win_loss_fig.data:
         fig.add_trace(trace, row=4, col=1)
 
@@ -48,62 +51,77 @@ def create_combined_subplots(executors: pd.DataFrame):
     return fig
 
 
-def get_pnl_traces(executors: pd.DataFrame):
+def get_performance_evolution(executors: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cumulative metrics of the executors in close time order, computed in a single pass for the trace builders, which
+    only read from it. The win and loss ratios are only defined on the executors with a position.
+    :param executors: Executors with close_timestamp, close_datetime, net_pnl_quote, net_pnl_pct and
+    filled_amount_quote. The frame is not modified.
+    :return: One row per executor with close_datetime, has_position, cum_net_pnl_quote, cum_filled_amount_quote,
+    cum_n_trades, win_ratio and loss_ratio.
+    """
+    executors = executors.sort_values("close_timestamp", kind="stable")
+    net_pnl_pct = executors["net_pnl_pct"].to_numpy()
+    has_position = net_pnl_pct != 0
+    cum_win_signals = np.cumsum(net_pnl_pct > 0)
+    cum_loss_signals = np.cumsum(net_pnl_pct < 0)
+    total_signals = np.maximum(cum_win_signals + cum_loss_signals, 1)
+    return pd.DataFrame({
+        "close_datetime": executors["close_datetime"].to_numpy(),
+        "has_position": has_position,
+        "cum_net_pnl_quote": executors["net_pnl_quote"].cumsum().to_numpy(),
+        "cum_filled_amount_quote": executors["filled_amount_quote"].cumsum().to_numpy() * 2,
+        "cum_n_trades": np.cumsum(has_position),
+        "win_ratio": cum_win_signals / total_signals,
+        "loss_ratio": cum_loss_signals / total_signals,
+    })
+
+
+def get_pnl_traces(evolution: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS):
     color_scheme = get_color_scheme()
-    executors.sort_values("close_timestamp", inplace=True)
-    executors["cum_net_pnl_quote"] = executors["net_pnl_quote"].cumsum()
+    sampled = evolution.iloc[downsample_line(evolution["close_datetime"], evolution["cum_net_pnl_quote"], max_points)]
     scatter_traces = go.Scatter(name="Cum Realized PnL",
-                                x=executors["close_datetime"],
-                                y=executors["cum_net_pnl_quote"],
-                                marker_color=executors["cum_net_pnl_quote"].apply(
-                                    lambda x: color_scheme["buy"] if x > 0 else color_scheme["sell"]),
+                                x=sampled["close_datetime"],
+                                y=sampled["cum_net_pnl_quote"],
+                                marker_color=get_sign_colors(sampled["cum_net_pnl_quote"], color_scheme["buy"],
+                                                             color_scheme["sell"]),
                                 showlegend=False,
                                 line_shape='hv',
                                 fill="tozeroy")
     return scatter_traces
 
 
-def get_volume_bar_traces(executors: pd.DataFrame):
+def get_volume_bar_traces(evolution: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS):
     color_scheme = get_color_scheme()
-    executors.sort_values("close_timestamp", inplace=True)
-    executors["cum_filled_amount_quote"] = executors["filled_amount_quote"].cumsum() * 2
+    sampled = evolution.iloc[downsample_line(evolution["close_datetime"], evolution["cum_filled_amount_quote"],
+                                             max_points)]
     scatter_traces = go.Scatter(name="Cum Volume",
-                                x=executors["close_datetime"],
-                                y=executors["cum_filled_amount_quote"],
-                                marker_color=executors["cum_filled_amount_quote"].apply(
-                                    lambda x: color_scheme["buy"] if x > 0 else color_scheme["sell"]),
+                                x=sampled["close_datetime"],
+                                y=sampled["cum_filled_amount_quote"],
+                                marker_color=get_sign_colors(sampled["cum_filled_amount_quote"], color_scheme["buy"],
+                                                             color_scheme["sell"]),
                                 showlegend=False,
                                 fill="tozeroy")
     return scatter_traces
 
 
-def get_total_executions_with_position_bar_traces(executors: pd.DataFrame):
+def get_total_executions_with_position_bar_traces(evolution: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS):
     color_scheme = get_color_scheme()
-    executors.sort_values("close_timestamp", inplace=True)
-    executors["cum_n_trades"] = (executors['net_pnl_pct'] != 0).cumsum()
+    sampled = evolution.iloc[downsample_line(evolution["close_datetime"], evolution["cum_n_trades"], max_points)]
     scatter_traces = go.Scatter(name="Cum Activity",
-                                x=executors["close_datetime"],
-                                y=executors["cum_n_trades"],
-                                marker_color=executors["cum_n_trades"].apply(
-                                    lambda x: color_scheme["buy"] if x > 0 else color_scheme["sell"]),
+                                x=sampled["close_datetime"],
+                                y=sampled["cum_n_trades"],
+                                marker_color=get_sign_colors(sampled["cum_n_trades"], color_scheme["buy"],
+                                                             color_scheme["sell"]),
                                 showlegend=False,
                                 line_shape='hv',
                                 fill="tozeroy")
     return scatter_traces
 
 
-def get_win_loss_ratio_fig(executors: pd.DataFrame):
-    df = executors.copy()
-    df.to_csv("executors.csv", index=False)
-    df.sort_values("close_timestamp", inplace=True)
-    df = df[df['net_pnl_pct'] != 0]
-    df['cum_win_signals'] = (df['net_pnl_pct'] > 0).cumsum()
-    df['cum_loss_signals'] = (df['net_pnl_pct'] < 0).cumsum()
-    df['acc_over_time'] = df['cum_win_signals'] / np.arange(1, len(df) + 1)
-
-    df['total_signals'] = df['cum_win_signals'] + df['cum_loss_signals']
-    df['win_ratio'] = df['cum_win_signals'] / df['total_signals']
-    df['loss_ratio'] = df['cum_loss_signals'] / df['total_signals']
+def get_win_loss_ratio_fig(evolution: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS):
+    df = evolution[evolution["has_position"]]
+    df = df.iloc[downsample_line(df["close_datetime"], df["win_ratio"], max_points)]
 
     fig = go.Figure()
 
@@ -3,15 +3,19 @@ from typing import List
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
+from backend.utils.executor_records import ExecutorRecord
+from frontend.visualization.downsampling import DEFAULT_MAX_POINTS, downsample_line
 
-def get_pnl_trace(executors: List[ExecutorInfo]):
+
+def get_pnl_trace(executors: List[ExecutorRecord], max_points: int = DEFAULT_MAX_POINTS, x_range=None):
     pnl = [e.net_pnl_quote for e in executors]
     cum_pnl = np.cumsum(pnl)
+    close_datetime = pd.to_datetime([e.close_timestamp for e in executors], unit="s")
+    positions = downsample_line(close_datetime, cum_pnl, max_points, x_range)
     return go.Scatter(
-        x=pd.to_datetime([e.close_timestamp for e in executors], unit="s"),
-        y=cum_pnl,
+        x=close_datetime[positions],
+        y=cum_pnl[positions],
         mode='lines',
         line=dict(color='gold', width=2, dash="dash"),
         name='Cumulative PNL'
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def get_default_layout(title=None, height=800, width=1800):
     layout = {
         "template": "plotly_dark",
@@ -39,3 +42,14 @@ def get_color_scheme():
         'volume': '#FFD700',  # Gold
         'price': '#00008B',  # Dark Blue
     }
+
+
+def get_sign_colors(values, positive_color, negative_color, zero_is_positive=False):
+    """
+    Color of each value by its sign, mapped with a single np.where over the whole series. Zero and missing values get
+    the negative color, or the positive one when zero_is_positive.
+    """
+    values = np.asarray(values, dtype=float)
+    if zero_is_positive:
+        return np.where(values < 0, negative_color, positive_color)
+    return np.where(values > 0, positive_color, negative_color)
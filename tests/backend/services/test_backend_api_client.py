@@ -0,0 +1,192 @@
+import asyncio
+import base64
+import gzip
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from backend.services.async_backend_api_client import AsyncBackendAPIClient
+from backend.services.backend_api_client import BackendAPIClient
+from backend.services.payload_codecs import ARROW_STREAM_MEDIA_TYPE, PARQUET_MEDIA_TYPE, decode_table, read_binary_table
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+CANDLES = pd.DataFrame({
+    "timestamp": [1700000000, 1700000060, 1700000120],
+    "open": [100.0, 101.5, 99.25],
+    "high": [102.0, 103.0, 101.0],
+    "low": [99.0, 100.5, 98.75],
+    "close": [101.5, 99.25, 100.0],
+    "volume": [12.5, 8.0, 20.25],
+})
+
+
+def arrow_stream(df: pd.DataFrame) -> bytes:
+    sink = io.BytesIO()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def parquet_file(df: pd.DataFrame) -> bytes:
+    sink = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink)
+    return sink.getvalue()
+
+
+class BackendHandler(BaseHTTPRequestHandler):
+    """Stand-in for the Backend API, answering in the table format chosen by `server.table_format`."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        route, _, bot_name = self.path.strip("/").rpartition("/")
+        if bot_name == "broken":
+            self._send(500, "application/json", b'{"detail": "boom"}')
+        elif route == "get-bot-status":
+            self._send_json({"status": "success", "data": {"bot_name": bot_name, "active": True}})
+        elif route == "all-controller-configs/bot":
+            self._send_json([{"id": f"{bot_name}_controller"}])
+        else:
+            self._send(404, "application/json", b'{"detail": "Not Found"}')
+
+    def do_POST(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/historical-candles":
+            if self.server.table_format == "arrow":
+                self._send(200, ARROW_STREAM_MEDIA_TYPE, arrow_stream(CANDLES))
+            elif self.server.table_format == "parquet":
+                self._send(200, PARQUET_MEDIA_TYPE, parquet_file(CANDLES))
+            else:
+                self._send_json(CANDLES.to_dict(orient="records"))
+        elif self.path == "/get-performance-results" and self.server.results_format == "arrow":
+            self._send(200, ARROW_STREAM_MEDIA_TYPE, arrow_stream(CANDLES))
+        elif self.path == "/get-performance-results" and self.server.results_format == "error":
+            self._send(500, "application/json", b'{"detail": "boom"}')
+        elif self.path == "/get-performance-results":
+            envelope = {"format": "arrow", "data": base64.b64encode(arrow_stream(CANDLES)).decode()}
+            self._send_json({"processed_data": envelope, "executors": [], "results": {"net_pnl": 1.5}})
+
+    def _send_json(self, body):
+        content = json.dumps(body).encode()
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            self._send(200, "application/json", gzip.compress(content), {"Content-Encoding": "gzip"})
+        else:
+            self._send(200, "application/json", content)
+
+    def _send(self, status, content_type, content, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def backend():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BackendHandler)
+    server.table_format = "json"
+    server.results_format = "envelope"
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(backend):
+    client = BackendAPIClient(host="127.0.0.1", port=backend.server_address[1])
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize("table_format", ["arrow", "parquet", "json"])
+def test_historical_candles_negotiates_table_format(backend, client, table_format):
+    backend.table_format = table_format
+    candles = client.get_historical_candles("binance", "BTC-USDT", "1m", start_time=1700000000, end_time=1700000120)
+    pd.testing.assert_frame_equal(candles, CANDLES)
+    _, headers = backend.requests[-1]
+    assert headers["Accept"].startswith(ARROW_STREAM_MEDIA_TYPE)
+    assert "arrow" in headers["X-Table-Format"]
+    assert "gzip" in headers["Accept-Encoding"]
+
+
+def test_performance_results_decode_envelope(client):
+    results = client.get_performance_results([{"id": "executor"}])
+    pd.testing.assert_frame_equal(results["processed_data"], CANDLES)
+    assert results["executors"] == []
+    assert results["results"] == {"net_pnl": 1.5}
+
+
+@pytest.mark.parametrize("results_format, match", [("arrow", "bare"), ("error", "returned an error")])
+def test_performance_results_reject_bare_tables_and_errors(backend, client, results_format, match):
+    backend.results_format = results_format
+    with pytest.raises(Exception, match=match):
+        client.get_performance_results([{"id": "executor"}])
+
+
+def test_decode_table_reads_records_and_binary_envelopes():
+    pd.testing.assert_frame_equal(decode_table(CANDLES.to_dict(orient="records")), CANDLES)
+    for table_format, content in [("arrow", arrow_stream(CANDLES)), ("parquet", parquet_file(CANDLES))]:
+        envelope = {"format": table_format, "data": base64.b64encode(content).decode()}
+        pd.testing.assert_frame_equal(decode_table(envelope), CANDLES)
+    pd.testing.assert_frame_equal(read_binary_table(parquet_file(CANDLES), PARQUET_MEDIA_TYPE), CANDLES)
+
+
+def test_async_client_fans_out_bot_requests(backend, client):
+    bot_names = ["bot_a", "bot_b", "broken"]
+
+    async def fetch():
+        async with AsyncBackendAPIClient.from_client(client, max_concurrency=2) as async_client:
+            return await asyncio.gather(async_client.get_bot_status_many(bot_names),
+                                        async_client.get_all_configs_from_bots(bot_names))
+
+    statuses, configs = asyncio.run(fetch())
+    assert statuses == {
+        "bot_a": {"status": "success", "data": {"bot_name": "bot_a", "active": True}},
+        "bot_b": {"status": "success", "data": {"bot_name": "bot_b", "active": True}},
+        "broken": None,
+    }
+    assert configs == {"bot_a": [{"id": "bot_a_controller"}], "bot_b": [{"id": "bot_b_controller"}], "broken": None}
+
+
+@pytest.mark.parametrize("table_format", ["arrow", "parquet", "json"])
+def test_async_client_decodes_binary_tables(backend, client, table_format):
+    backend.table_format = table_format
+
+    async def fetch():
+        async with AsyncBackendAPIClient.from_client(client) as async_client:
+            return await asyncio.gather(
+                async_client.get_historical_candles("binance", "BTC-USDT", "1m", 1700000000, 1700000120),
+                async_client.get_performance_results([{"id": "executor"}]))
+
+    candles, results = asyncio.run(fetch())
+    pd.testing.assert_frame_equal(candles, CANDLES)
+    pd.testing.assert_frame_equal(results["processed_data"], CANDLES)
+    assert all("arrow" in headers["X-Table-Format"] and headers["Authorization"].startswith("Basic ")
+               for _, headers in backend.requests)
+
+
+@pytest.mark.parametrize("results_format, match", [("arrow", "bare"), ("error", "returned an error")])
+def test_async_client_rejects_bare_tables_and_errors(backend, client, results_format, match):
+    backend.results_format = results_format
+
+    async def fetch():
+        async with AsyncBackendAPIClient.from_client(client) as async_client:
+            return await async_client.get_performance_results([{"id": "executor"}])
+
+    with pytest.raises(Exception, match=match):
+        asyncio.run(fetch())
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.utils.executors_orders_index import EXECUTORS_WITH_ORDERS_COLUMNS, ExecutorsOrdersIndex
+
+
+def make_orders(order_ids, statuses, price=100.0, timestamp=1):
+    return pd.DataFrame({
+        "client_order_id": order_ids,
+        "last_status": statuses,
+        "last_update_timestamp": timestamp,
+        "price": [price + i for i in range(len(order_ids))],
+        "amount": [1.0 + i for i in range(len(order_ids))],
+        "position": "OPEN",
+    })
+
+
+def exploded_merge(executor_ids, order_ids, orders):
+    """Reference join: explode the order ids of the executors and merge them with the completed orders."""
+    executors = pd.DataFrame({"executor_id": executor_ids, "order_id": order_ids}).explode("order_id")
+    completed = orders[orders["last_status"].isin(["SellOrderCompleted", "BuyOrderCompleted"])]
+    completed = completed.drop_duplicates(subset="client_order_id", keep="last")
+    merged = executors.merge(completed, left_on="order_id", right_on="client_order_id")
+    return merged[EXECUTORS_WITH_ORDERS_COLUMNS].reset_index(drop=True)
+
+
+@pytest.fixture
+def index():
+    orders = make_orders(["o1", "o2", "o3", "o4"],
+                         ["BuyOrderCompleted", "SellOrderCompleted", "OrderCancelled", "BuyOrderCompleted"])
+    return ExecutorsOrdersIndex(["e1", "e2", "e3"], [["o2", "o1"], ["o3", "o4", "o5"], None], orders)
+
+
+def test_orders_of_keeps_the_completed_orders_of_the_executor(index):
+    assert index.orders_of("e1")["client_order_id"].tolist() == ["o2", "o1"]
+    assert index.orders_of("e2")["client_order_id"].tolist() == ["o4"]
+    assert index.orders_of("e3").empty
+    with pytest.raises(KeyError):
+        index.orders_of("unknown")
+
+
+def test_order_aggregates_of_an_executor(index):
+    aggregates = index.order_aggregates("e1")
+    assert aggregates["orders_count"] == 2
+    assert aggregates["filled_amount"] == pytest.approx(3.0)
+    assert aggregates["filled_quote"] == pytest.approx(100.0 * 1 + 101.0 * 2)
+    assert aggregates["average_price"] == pytest.approx(302.0 / 3)
+    empty = index.order_aggregates("e3")
+    assert empty["orders_count"] == 0 and np.isnan(empty["average_price"])
+
+
+def test_updates_relink_orders_and_replace_executors(index):
+    index.update_orders(make_orders(["o3", "o5", "o1"], ["SellOrderCompleted", "BuyOrderCompleted", "OrderCancelled"],
+                                    price=200.0, timestamp=2))
+    assert index.orders_of("e1")["client_order_id"].tolist() == ["o2"]
+    assert index.orders_of("e2")["client_order_id"].tolist() == ["o3", "o4", "o5"]
+    assert index.order_aggregates("e2")["filled_quote"] == pytest.approx(200.0 * 1 + 103.0 * 4 + 201.0 * 2)
+
+    index.add_executors(["e1"], [["o3"]])
+    assert index.orders_of("e1")["client_order_id"].tolist() == ["o3"]
+    assert index.executors_with_orders()["executor_id"].value_counts().to_dict() == {"e2": 3, "e1": 1}
+
+
+def test_executors_with_orders_matches_the_exploded_merge_after_compaction():
+    rng = np.random.default_rng(0)
+    order_ids = [f"o{i}" for i in range(200)]
+    executor_ids = [f"e{i}" for i in range(50)]
+    executor_order_ids = [order_ids[4 * i:4 * i + 4] for i in range(50)]
+    statuses = ["BuyOrderCompleted", "OrderCancelled"]
+    latest = make_orders(order_ids, rng.choice(statuses, len(order_ids)))
+    index = ExecutorsOrdersIndex(executor_ids, executor_order_ids, latest)
+    for timestamp in range(2, 30):
+        updated_ids = list(rng.choice(order_ids, 40, replace=False))
+        updated = make_orders(updated_ids, rng.choice(statuses, 40, p=[0.8, 0.2]), price=float(timestamp),
+                              timestamp=timestamp)
+        index.update_orders(updated)
+        latest = pd.concat([latest[~latest["client_order_id"].isin(updated_ids)], updated], ignore_index=True)
+        assert len(index.completed_orders) <= 2 * np.count_nonzero(index.order_rows >= 0)
+
+    expected = exploded_merge(executor_ids, executor_order_ids, latest)
+    pd.testing.assert_frame_equal(index.executors_with_orders(), expected, check_dtype=False)
+    for executor_id in executor_ids:
+        rows = expected[expected["executor_id"] == executor_id]
+        assert index.order_aggregates(executor_id)["filled_quote"] == pytest.approx((rows["price"] * rows["amount"]).sum())
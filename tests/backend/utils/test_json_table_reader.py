@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.utils.json_table_reader import iter_json_records, read_json_table
+
+HETEROGENEOUS_RECORDS = [{"a": 1, "b": 2}, {"a": 3, "c": 9}, {"a": 5, "b": 6}]
+
+
+def test_iter_json_records_reads_arrays_and_ndjson():
+    assert list(iter_json_records(json.dumps(HETEROGENEOUS_RECORDS))) == HETEROGENEOUS_RECORDS
+    assert list(iter_json_records("\n".join(json.dumps(record) for record in HETEROGENEOUS_RECORDS))) == \
+        HETEROGENEOUS_RECORDS
+
+
+@pytest.mark.parametrize("columns", [None, ["a", "b"], ["b"], ["c", "a"]])
+def test_read_json_table_matches_pandas_on_heterogeneous_records(columns):
+    table = read_json_table(json.dumps(HETEROGENEOUS_RECORDS), columns=columns)
+    expected = pd.DataFrame(HETEROGENEOUS_RECORDS)
+    if columns is not None:
+        expected = expected[[column for column in expected.columns if column in columns]]
+    pd.testing.assert_frame_equal(table, expected)
+
+
+def test_read_json_table_fills_columns_first_seen_late():
+    records = [{"a": 1}, {"a": 2}, {"a": 3, "b": "x"}, {"b": "y"}]
+    table = read_json_table(json.dumps(records))
+    pd.testing.assert_frame_equal(table, pd.DataFrame(records))
+
+
+def test_read_json_table_packs_numeric_columns():
+    records = [{"int": 1, "float": 1, "nullable": 1, "text": 1, "flag": True},
+               {"int": 2, "float": 2.5, "nullable": None, "text": "x", "flag": False}]
+    table = read_json_table(json.dumps(records))
+    assert table["int"].dtype == np.int64
+    assert table["float"].dtype == np.float64
+    assert table["nullable"].dtype == np.float64 and np.isnan(table["nullable"].iloc[1])
+    assert table["text"].tolist() == [1, "x"]
+    assert table["flag"].dtype == bool
+
+
+@pytest.mark.parametrize("text", ["", "[]", "{}", " [ ] "])
+def test_read_json_table_of_empty_input_is_empty(text):
+    table = read_json_table(text)
+    assert table.empty and len(table) == 0
+
+
+def test_read_json_table_reads_column_oriented_tables():
+    expected = pd.DataFrame(HETEROGENEOUS_RECORDS)
+    table = read_json_table(expected.to_json())
+    pd.testing.assert_frame_equal(table.reset_index(drop=True), expected)
+    assert read_json_table(expected.to_json(), columns=["b", "z"]).columns.tolist() == ["b"]
@@ -0,0 +1,83 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.models.executors import CloseType
+
+from backend.utils.performance_metrics import EMPTY_RESULTS, summarize_results, summarize_results_by
+
+# Executors and the results the backend `summarize_results` of the backtesting engine computes for them, globally and
+# for each side.
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "fixtures", "performance_results.json")
+
+
+@pytest.fixture(scope="module")
+def fixture():
+    with open(FIXTURE_PATH) as fixture_file:
+        return json.load(fixture_file)
+
+
+@pytest.fixture
+def executors_df(fixture):
+    return pd.DataFrame(fixture["executors"])
+
+
+@pytest.fixture
+def typed_executors_df(executors_df):
+    typed = executors_df.copy()
+    typed["side"] = [TradeType(config["side"]) for config in typed["config"]]
+    typed["close_type"] = typed["close_type"].map(CloseType)
+    return typed
+
+
+def assert_results_equal(results, expected):
+    assert results.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert results[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+        else:
+            assert results[key] == value, key
+
+
+def test_summarize_results_matches_backend(fixture, executors_df, typed_executors_df):
+    assert_results_equal(summarize_results(executors_df, fixture["total_amount_quote"]), fixture["results"])
+    assert_results_equal(summarize_results(typed_executors_df, fixture["total_amount_quote"]), fixture["results"])
+
+
+def test_summarize_results_by_side_matches_backend(fixture, executors_df):
+    results = summarize_results_by(executors_df, "side", fixture["total_amount_quote"])
+    assert {side.name for side in results} == fixture["results_by_side"].keys()
+    for side, side_results in results.items():
+        assert_results_equal(side_results, fixture["results_by_side"][side.name])
+
+
+def test_summarize_results_of_no_executors(executors_df):
+    assert summarize_results(executors_df.iloc[:0]) == EMPTY_RESULTS
+
+
+def test_summarize_results_by_keeps_null_groups(fixture, executors_df):
+    executors_df = executors_df.copy()
+    executors_df["config"] = [{key: value for key, value in config.items() if key != "side" or position % 5 != 0}
+                              for position, config in enumerate(executors_df["config"])]
+    executors_df.loc[executors_df.index % 4 == 1, "controller_id"] = None
+    total_amount_quote = fixture["total_amount_quote"]
+
+    by_side = summarize_results_by(executors_df, "side", total_amount_quote)
+    has_side = executors_df["config"].map(lambda config: "side" in config)
+    assert sum(results["total_executors"] for results in by_side.values()) == len(executors_df)
+    for side, side_results in by_side.items():
+        if pd.isna(side):
+            expected = summarize_results(executors_df[~has_side], total_amount_quote)
+        else:
+            sides = executors_df["config"].map(lambda config: config.get("side"))
+            expected = summarize_results(executors_df[sides == side.value], total_amount_quote)
+        assert_results_equal(side_results, expected)
+
+    by_controller = summarize_results_by(executors_df, "controller_id", total_amount_quote)
+    assert sum(results["total_executors"] for results in by_controller.values()) == len(executors_df)
+    for controller_id, controller_results in by_controller.items():
+        mask = executors_df["controller_id"].isna() if pd.isna(controller_id) else \
+            executors_df["controller_id"] == controller_id
+        assert_results_equal(controller_results, summarize_results(executors_df[mask], total_amount_quote))